@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -18,6 +18,25 @@ else:
     SQLALCHEMY_DATABASE_URL = f"postgresql://{DB_USER}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+# Word-similarity cutoff for fuzzy search (%> operator). Set once per physical
+# connection rather than per request, and only when it departs from pg_trgm's
+# own default, so an unconfigured deployment pays no round trip on connect.
+PG_TRGM_DEFAULT_THRESHOLD = 0.6
+FUZZY_THRESHOLD = float(os.getenv("FUZZY_THRESHOLD", str(PG_TRGM_DEFAULT_THRESHOLD)))
+
+def set_trgm_threshold(dbapi_connection, connection_record):
+    with dbapi_connection.cursor() as cursor:
+        # SET cannot take bind parameters (psycopg 3 binds server-side)
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, false)",
+            (str(FUZZY_THRESHOLD),),
+        )
+    dbapi_connection.commit()
+
+if "FUZZY_THRESHOLD" in os.environ or FUZZY_THRESHOLD != PG_TRGM_DEFAULT_THRESHOLD:
+    event.listen(engine, "connect", set_trgm_threshold)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
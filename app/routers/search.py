@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, Request, Query
+from fastapi import APIRouter, Depends, Request, Response, Query
+from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text, case, or_
-from typing import Optional, List
+from sqlalchemy import Float, func, case, or_
+from typing import Callable, NamedTuple, Optional, List, Sequence
+from pydantic import TypeAdapter
 from ..database import get_db
 from ..models import Concept, ConceptEmbedding
 from ..schemas import ConceptBase
 from fastapi.templating import Jinja2Templates
 from sentence_transformers import SentenceTransformer
+from collections import OrderedDict
+import functools
+import os
+import threading
+import time
 import numpy as np
 
 router = APIRouter(
@@ -15,6 +22,9 @@ router = APIRouter(
 )
 
 templates = Jinja2Templates(directory="app/templates")
+# Rendered results are memoized below, so template edits already need a
+# restart; skip the per-lookup mtime check on the compiled template too
+templates.env.auto_reload = False
 
 # Load embedding model once at startup (lazy loading on first semantic search)
 _embedding_model = None
@@ -26,44 +36,129 @@ def get_embedding_model():
         _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
     return _embedding_model
 
-@router.get("/", response_model=List[ConceptBase])
-def search_concepts(
-    request: Request,
-    q: str = Query("", min_length=0),
-    vocabulary_id: Optional[str] = None,
-    domain_id: Optional[str] = None,
-    fuzzy: Optional[str] = None,
-    semantic: Optional[str] = None,
-    standard_only: Optional[str] = None,
-    limit: int = 50,
-    db: Session = Depends(get_db)
-):
-    # Early return for empty queries
-    if not q or len(q.strip()) == 0:
-        if request.headers.get("HX-Request"):
-            return templates.TemplateResponse("search_results.html", {"request": request, "results": []})
-        return []
+@functools.lru_cache(maxsize=1024)
+def embed_query(q: str) -> np.ndarray:
+    """Encode a search query, reusing the embedding for repeated queries"""
+    embedding = get_embedding_model().encode(
+        q,
+        convert_to_numpy=True,
+        normalize_embeddings=True
+    )
+    # The cached array is shared between requests, so freeze it
+    embedding.setflags(write=False)
+    return embedding
+
+class ResultRow(NamedTuple):
+    """The concept fields search_results.html renders, as a hashable row"""
+    concept_id: int
+    concept_name: str
+    concept_code: str
+    vocabulary_id: str
+    domain_id: str
+    concept_class_id: str
+    standard_concept: Optional[str]
+
+@functools.lru_cache(maxsize=128)
+def render_search_results(
+    query: Optional[str],
+    limit: Optional[int],
+    search_mode: Optional[str],
+    rows: tuple[ResultRow, ...],
+) -> str:
+    """Render the HTMX results partial, reusing the markup for identical result sets"""
+    return templates.get_template("search_results.html").render(
+        results=rows,
+        query=query,
+        limit=limit,
+        search_mode=search_mode,
+    )
+
+def htmx_results(
+    query: str, limit: int, search_mode: str, results: Sequence[ConceptBase]
+) -> HTMLResponse:
+    """Build the HTMX results response from concepts via the render cache"""
+    rows = tuple(
+        ResultRow(
+            c.concept_id, c.concept_name, c.concept_code, c.vocabulary_id,
+            c.domain_id, c.concept_class_id, c.standard_concept,
+        )
+        for c in results
+    )
+    return HTMLResponse(render_search_results(query, limit, search_mode, rows))
+
+# Shortest query that fuzzy (trigram) mode will run
+FUZZY_MIN_LENGTH = 2
+
+# Vocabulary data only changes on a reload, so identical searches can share
+# results for a while. Entries expire after SEARCH_CACHE_TTL seconds, and the
+# least recently used entry is evicted beyond SEARCH_CACHE_SIZE.
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "512"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+
+_search_cache: "OrderedDict[tuple, tuple[float, tuple[ConceptBase, ...]]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+def search_cache_key(
+    search_mode: str,
+    q: str,
+    vocabulary_id: Optional[str],
+    domain_id: Optional[str],
+    standard_only: bool,
+    limit: int,
+) -> tuple:
+    """Build the result cache key, folding query case where it cannot change results"""
+    # ILIKE, the lower() ranking and pg_trgm trigrams all ignore case, so
+    # "Diabetes" and "diabetes" share an entry; embeddings may not, so
+    # semantic queries keep their case
+    if search_mode != "semantic":
+        q = q.lower()
+    return (search_mode, q, vocabulary_id, domain_id, standard_only, limit)
+
+# Validates a whole result list in one pydantic-core call
+CONCEPT_RESULTS = TypeAdapter(tuple[ConceptBase, ...])
+
+def cached_search(key: tuple, run_query: Callable[[], list]) -> tuple[ConceptBase, ...]:
+    """Return cached results for key, running and caching the query on a miss or expiry"""
+    now = time.monotonic()
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is not None and now - entry[0] < SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(key)
+            return entry[1]
+
+    # Detach results from the session as validated models so they can be shared
+    results = CONCEPT_RESULTS.validate_python(run_query(), from_attributes=True)
 
-    # Determine search mode
-    use_semantic = (semantic == "true")
-    use_fuzzy = (fuzzy == "true")
+    with _search_cache_lock:
+        _search_cache[key] = (now, results)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    return results
+
+# Only the ConceptBase columns are selected, so results come back as plain
+# rows without building ORM instances or identity-map entries
+CONCEPT_COLUMNS = tuple(getattr(Concept, name) for name in ConceptBase.model_fields)
+
+def run_search(
+    db: Session,
+    search_mode: str,
+    q: str,
+    vocabulary_id: Optional[str],
+    domain_id: Optional[str],
+    standard_only: bool,
+    limit: int,
+) -> list:
+    """Run the search query for one mode and return the matching concept rows"""
     q_lower = q.lower()
 
     # SEMANTIC MODE: Vector similarity search
-    if use_semantic:
+    if search_mode == "semantic":
         # Generate embedding for query
-        model = get_embedding_model()
-        query_embedding = model.encode(
-            q,
-            convert_to_numpy=True,
-            normalize_embeddings=True
-        )
+        query_embedding = embed_query(q)
 
         # Build query using cosine distance operator (<=>)
-        query = db.query(
-            Concept,
-            (1 - ConceptEmbedding.embedding.cosine_distance(query_embedding)).label("similarity")
-        ).join(
+        query = db.query(*CONCEPT_COLUMNS).join(
             ConceptEmbedding,
             Concept.concept_id == ConceptEmbedding.concept_id
         )
@@ -73,50 +168,49 @@ def search_concepts(
             query = query.filter(Concept.vocabulary_id == vocabulary_id)
         if domain_id:
             query = query.filter(Concept.domain_id == domain_id)
-        if standard_only == "true":
+        if standard_only:
             query = query.filter(Concept.standard_concept == 'S')
 
-        # Order by similarity (highest first)
-        query = query.order_by(text("similarity DESC"))
+        # Order by distance (most similar first). Unfiltered, ORDER BY <=> ASC
+        # lets the ivfflat index drive the query. That scan is approximate
+        # and filters are applied after it, so a filtered search could come
+        # back with far fewer than limit rows; filtered searches order by the
+        # derived similarity instead, which the index cannot serve, and rank
+        # exactly
+        distance = ConceptEmbedding.embedding.cosine_distance(query_embedding)
+        if vocabulary_id or domain_id or standard_only:
+            query = query.order_by((1 - distance).desc())
+        else:
+            query = query.order_by(distance)
 
-        # Execute and extract concepts
-        results_with_similarity = query.limit(limit).all()
-        results = [concept for concept, similarity in results_with_similarity]
-
-        # Return response
-        if request.headers.get("HX-Request"):
-            return templates.TemplateResponse("search_results.html", {
-                "request": request,
-                "results": results,
-                "query": q,
-                "limit": limit,
-                "search_mode": "semantic"
-            })
-        return results
+        return query.limit(limit).all()
 
     # Start with base query for text-based search
-    query = db.query(Concept)
+    query = db.query(*CONCEPT_COLUMNS)
 
-    if use_fuzzy:
+    if search_mode == "fuzzy":
         # FUZZY MODE: Only fuzzy match on concept_name
         # Use exact matching for concept_code (more precise)
+        # Word similarity (%>) compares the query against the best-matching
+        # extent of the name rather than the whole name, so long names are not
+        # penalised and the trigram index only yields candidates close to q
         query = query.filter(
             or_(
-                Concept.concept_name.op("%")(q),
+                Concept.concept_name.op("%>")(q),
                 Concept.concept_code.ilike(f"%{q}%")
             )
         )
 
-        # Calculate similarity for name only
-        name_similarity = func.similarity(Concept.concept_name, q)
+        # Word-similarity distance for name only (1 - word_similarity)
+        name_distance = Concept.concept_name.op("<->>", return_type=Float)(q)
 
-        # Order by: exact code match first, then name similarity
+        # Order by: exact code match first, then closest name
         query = query.order_by(
             case(
                 (func.lower(Concept.concept_code) == q_lower, 1),
                 else_=0
             ).desc(),
-            name_similarity.desc(),
+            name_distance,
             Concept.concept_name
         )
 
@@ -155,26 +249,54 @@ def search_concepts(
         query = query.filter(Concept.domain_id == domain_id)
 
     # Apply standard concepts filter (NEW)
-    if standard_only == "true":
+    if standard_only:
         query = query.filter(Concept.standard_concept == 'S')
-    
-    results = query.limit(limit).all()
 
-    # Determine search mode for display
-    if use_fuzzy:
+    return query.limit(limit).all()
+
+@router.get("/", response_model=List[ConceptBase])
+def search_concepts(
+    request: Request,
+    response: Response,
+    q: str = Query("", min_length=0),
+    vocabulary_id: Optional[str] = None,
+    domain_id: Optional[str] = None,
+    fuzzy: Optional[str] = None,
+    semantic: Optional[str] = None,
+    standard_only: Optional[str] = None,
+    limit: int = 50,
+    db: Session = Depends(get_db)
+):
+    # Early return for empty queries, before the session touches the database
+    q = q.strip()
+    if not q:
+        if request.headers.get("HX-Request"):
+            # The template renders only "No results found." for an empty list
+            return htmx_results("", 0, "", [])
+        response.headers["X-Result-Count"] = "0"
+        return []
+
+    # Determine search mode (semantic takes precedence over fuzzy).
+    # Trigram similarity is meaningless for a single character, so such
+    # queries fall back to a substring match
+    if semantic == "true":
+        search_mode = "semantic"
+    elif fuzzy == "true" and len(q) >= FUZZY_MIN_LENGTH:
         search_mode = "fuzzy"
     else:
         search_mode = "exact"
+    use_standard_only = (standard_only == "true")
+
+    key = search_cache_key(search_mode, q, vocabulary_id, domain_id, use_standard_only, limit)
+    results = cached_search(key, lambda: run_search(
+        db, search_mode, q, vocabulary_id, domain_id, use_standard_only, limit
+    ))
 
     # If HTMX request, return partial with query for match detection
     if request.headers.get("HX-Request"):
-        return templates.TemplateResponse("search_results.html", {
-            "request": request,
-            "results": results,
-            "query": q,
-            "limit": limit,
-            "search_mode": search_mode
-        })
-
-    # If JSON request (API), return list
-    return results
+        return htmx_results(q, limit, search_mode, results)
+
+    # If JSON request (API), return list; the count header lets clients
+    # size the result without parsing the body
+    response.headers["X-Result-Count"] = str(len(results))
+    return list(results)
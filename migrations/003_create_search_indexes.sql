@@ -0,0 +1,50 @@
+-- Text Search - Trigram Indexes
+-- This migration adds GIN trigram indexes backing the /search/ endpoint
+-- Without them every ILIKE '%q%' and fuzzy (pg_trgm) query is a sequential
+-- scan over the full concept table
+
+-- Enable pg_trgm extension (if not already enabled)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Trigram index on concept_name
+-- Serves both search modes on the raw column (no lower() needed: trigrams
+-- are case-folded, so the same index answers case-insensitive ILIKE):
+--   exact mode: concept_name ILIKE '%q%'
+--   fuzzy mode: pg_trgm similarity operators on concept_name
+CREATE INDEX IF NOT EXISTS idx_concept_name_trgm ON concept
+USING gin (concept_name gin_trgm_ops);
+
+-- Trigram index on concept_code
+-- Both modes OR the name predicate with concept_code ILIKE '%q%'; a
+-- BitmapOr needs an index on each side, so without this one the whole
+-- predicate falls back to a sequential scan
+CREATE INDEX IF NOT EXISTS idx_concept_code_trgm ON concept
+USING gin (concept_code gin_trgm_ops);
+
+-- Partial trigram index over standard concepts only
+-- standard_only=true searches filter on standard_concept = 'S'; this smaller
+-- index lets the planner skip non-standard rows instead of rechecking them
+CREATE INDEX IF NOT EXISTS idx_concept_name_trgm_standard ON concept
+USING gin (concept_name gin_trgm_ops)
+WHERE standard_concept = 'S';
+
+-- Refresh planner statistics so the new index is picked up immediately
+ANALYZE concept;
+
+COMMENT ON INDEX idx_concept_name_trgm IS
+'GIN trigram index on concept_name for ILIKE substring and fuzzy similarity search.';
+
+COMMENT ON INDEX idx_concept_code_trgm IS
+'GIN trigram index on concept_code for ILIKE substring search.';
+
+COMMENT ON INDEX idx_concept_name_trgm_standard IS
+'Partial GIN trigram index on concept_name for standard concepts (standard_only searches).';
+
+-- Verify the index is used (expect Bitmap Index Scan on idx_concept_name_trgm):
+-- EXPLAIN (ANALYZE) SELECT concept_id FROM concept WHERE concept_name ILIKE '%diabetes%';
+-- EXPLAIN (ANALYZE) SELECT concept_id FROM concept
+--   WHERE concept_name ILIKE '%diabetes%' OR concept_code ILIKE '%diabetes%';
+--   (expect BitmapOr over idx_concept_name_trgm and idx_concept_code_trgm)
+-- EXPLAIN (ANALYZE) SELECT concept_id FROM concept
+--   WHERE concept_name ILIKE '%diabetes%' AND standard_concept = 'S';
+--   (expect Bitmap Index Scan on idx_concept_name_trgm_standard)
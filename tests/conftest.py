@@ -4,16 +4,27 @@ This test suite uses a live PostgreSQL database with OHDSI CDM vocabulary data.
 Tests are designed to work with any standard OHDSI vocabulary database instance.
 """
 
-from typing import Generator
+import functools
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, NamedTuple, Optional
 
+import orjson
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from httpx import Response
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.main import app
 from app.database import get_db
-from app.models import Concept, Vocabulary, Domain
+from app.models import Concept, Vocabulary
+from app.routers import search
+
+if TYPE_CHECKING:
+    from selectolax.lexbor import LexborHTMLParser
 
 
 # Test database configuration
@@ -34,147 +45,355 @@ def db_engine():
     return engine
 
 
-@pytest.fixture(scope="function")
-def db_session(db_engine) -> Generator[Session, None, None]:
+@pytest.fixture(scope="session")
+def db_connection(db_engine) -> Generator[Connection, None, None]:
     """
-    Create a database session with transaction rollback for test isolation.
+    Open a single database connection shared by the whole test session.
 
-    Each test gets a fresh database session within a transaction that is
-    rolled back after the test completes. This ensures tests don't modify
-    the database and maintains isolation between tests.
+    The connection runs inside an outer transaction that is rolled back
+    when the session ends, so requests made through the test client can
+    never modify the database.
 
     Args:
         db_engine: Database engine fixture
 
     Yields:
-        Session: SQLAlchemy database session
+        Connection: SQLAlchemy connection with an open transaction
     """
-    # Create a connection and begin a transaction
     connection = db_engine.connect()
     transaction = connection.begin()
 
-    # Create a session bound to this connection
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=connection)
-    session = TestSessionLocal()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection: Connection) -> Generator[Session, None, None]:
+    """
+    Create a database session with savepoint rollback for test isolation.
+
+    Each test gets a fresh session on the shared ``db_connection`` inside a
+    SAVEPOINT that is rolled back after the test completes. This keeps tests
+    isolated without checking out a new connection per test.
+
+    Args:
+        db_connection: Shared database connection fixture
+
+    Yields:
+        Session: SQLAlchemy database session
+    """
+    # Begin a savepoint inside the session-wide outer transaction
+    savepoint = db_connection.begin_nested()
+
+    # Join the connection's transaction instead of starting a new one
+    session = Session(
+        bind=db_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     try:
         yield session
     finally:
-        # Rollback the transaction to undo any changes
+        # Rollback the savepoint to undo any changes
         session.close()
-        transaction.rollback()
-        connection.close()
+        if savepoint.is_active:
+            savepoint.rollback()
 
 
-@pytest.fixture
-def client(db_session: Session) -> Generator[TestClient, None, None]:
+@pytest.fixture(scope="session")
+def _db_client(db_connection: Connection) -> Generator[TestClient, None, None]:
     """
     Create a FastAPI test client with a real database session.
 
-    The database session is wrapped in a transaction that rolls back
-    after each test, ensuring test isolation.
+    Tests use ``client``, which is this client after ``_warmup`` has run.
+
+    The client is created once per test session and entered in a single
+    ``with`` block, so the ASGI portal, event loop and lifespan run once
+    and are reused by every request. Each request gets its own session
+    bound to the shared connection from ``db_connection``.
 
     Args:
-        db_session: Database session fixture
+        db_connection: Shared database connection fixture
 
     Yields:
         TestClient: FastAPI test client with overridden database dependency
     """
+    TestSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )
+
     def override_get_db() -> Generator[Session, None, None]:
+        session = TestSessionLocal()
         try:
-            yield db_session
+            yield session
         finally:
-            pass  # Session cleanup handled by db_session fixture
+            session.close()
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
+    with TestClient(app, backend="asyncio") as test_client:
         yield test_client
 
     app.dependency_overrides.clear()
 
 
+class _StubSession:
+    """Stand-in database session that fails any test which touches it."""
+
+    def __getattr__(self, name: str) -> Any:
+        raise AssertionError(f"Unexpected database access: Session.{name}")
+
+
 @pytest.fixture(scope="session")
-def sample_concept_id(db_engine) -> int:
+def no_db_client() -> Generator[TestClient, None, None]:
     """
-    Get a valid concept ID from the database for testing.
+    Create a test client for a bare app with only the search router mounted.
 
-    Queries the database for a standard SNOMED concept to use in tests.
-    Falls back to any standard concept if SNOMED is not available.
+    The database dependency is replaced by ``_StubSession``, so tests that
+    only exercise request handling (e.g. blank queries) run without any
+    Postgres round trips and fail loudly if the handler reaches the DB.
+
+    Yields:
+        TestClient: Test client whose database dependency is a stub
+    """
+    no_db_app = FastAPI()
+    no_db_app.include_router(search.router)
+    no_db_app.dependency_overrides[get_db] = lambda: _StubSession()
+
+    with TestClient(no_db_app, backend="asyncio") as test_client:
+        yield test_client
+
+
+# Statements SQLAlchemy issues to manage savepoints, not to run queries
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@contextmanager
+def recorded_statements(engine: Engine) -> Iterator[list[str]]:
+    """
+    Collect the SQL statements the engine executes inside the block.
+
+    Requests through ``client`` run inside a SAVEPOINT on the shared
+    connection; that bookkeeping is left out so only real queries count.
+    """
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_SAVEPOINT_PREFIXES):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def rjson(response: Response) -> Any:
+    """Decode a response body with orjson instead of the stdlib json module."""
+    return orjson.loads(response.content)
+
+
+def is_html(response: Response) -> bool:
+    """Check that the response media type, ignoring parameters, is text/html."""
+    content_type = response.headers.get("content-type", "")
+    return content_type.split(";", 1)[0].strip() == "text/html"
+
+
+class CachedResponse(NamedTuple):
+    """Status code, decoded JSON body (None unless JSON), headers, raw body and media type of a memoized GET."""
+
+    status_code: int
+    json: Any
+    headers: dict[str, str]
+    content: bytes
+    content_type: str
+
+
+@pytest.fixture(scope="session")
+def cached_get(client: TestClient) -> Callable[..., CachedResponse]:
+    """
+    Memoize GET requests by path and query parameters for the whole test session.
+
+    The vocabulary data is static and tests never write to it, so tests that
+    issue an identical request (e.g. ``/search/`` with ``{"q": searchable_term}``)
+    share one response instead of repeating the same database query.
 
     Args:
-        db_engine: Database engine fixture
+        client: FastAPI test client
 
     Returns:
-        int: A valid concept ID from the database
+        Callable: Function taking a path and optional params dict and returning
+            a CachedResponse
     """
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = TestSessionLocal()
+    @functools.lru_cache(maxsize=256)
+    def _get(path: str, params: Optional[tuple[tuple[str, Any], ...]]) -> CachedResponse:
+        response = client.get(path, params=params)
+        content_type = response.headers.get("content-type", "")
+        # Decode JSON once with orjson so every consumer shares the parsed
+        # body; HTML and other responses have no JSON to decode
+        return CachedResponse(
+            response.status_code,
+            rjson(response) if content_type.startswith("application/json") else None,
+            dict(response.headers),
+            response.content,
+            content_type.split(";")[0],
+        )
+
+    def _cached_get(path: str, params: Optional[dict[str, Any]] = None) -> CachedResponse:
+        # Dicts are unhashable; key the cache on the sorted items instead
+        return _get(path, tuple(sorted(params.items())) if params else None)
+
+    return _cached_get
+
+
+@pytest.fixture(scope="session")
+def _warmup(request: pytest.FixtureRequest, _db_client: TestClient) -> None:
+    """
+    Prime the app and database before the first test that uses ``client``.
+
+    The first requests pay for connection checkout, SQL compilation,
+    Jinja template loading and reading the trigram index pages into
+    shared buffers. Issuing them up front keeps that one-time cost out of
+    whichever test happens to run first, including the index timing checks
+    in test_index_performance and test_index_benchmark.
 
+    Args:
+        request: Pytest request, used to resolve the search term lazily
+        _db_client: FastAPI test client with a real database session
+    """
+    _db_client.get("/")
+    _db_client.get("/")
+
+    # Search warmup needs a term; with no searchable data there is nothing
+    # to warm, and the tests that need one skip on their own
     try:
-        # Try to get a SNOMED standard concept
-        concept = session.query(Concept).filter(
-            Concept.vocabulary_id == "SNOMED",
-            Concept.standard_concept == "S",
-            Concept.domain_id == "Condition"
-        ).first()
+        term = request.getfixturevalue("searchable_term")
+    except pytest.skip.Exception:
+        return
+    _db_client.get("/search/", params={"q": term})
+    _db_client.get("/search/", params={"q": term, "fuzzy": "true", "standard_only": "true"})
 
-        # Fallback to any standard concept
-        if not concept:
-            concept = session.query(Concept).filter(
-                Concept.standard_concept == "S"
-            ).first()
 
-        if not concept:
-            pytest.skip("No standard concepts found in database")
+@pytest.fixture(scope="session")
+def client(_db_client: TestClient, _warmup: None) -> TestClient:
+    """
+    Provide the warmed-up, database-backed test client.
 
-        return concept.concept_id
-    finally:
-        session.close()
+    Tests that never touch the database (``no_db_client`` and pure unit
+    tests) do not request this fixture, so they run without Postgres.
+
+    Args:
+        _db_client: FastAPI test client with a real database session
+        _warmup: Ensures the app and database are primed first
+
+    Returns:
+        TestClient: FastAPI test client with overridden database dependency
+    """
+    return _db_client
+
+
+@pytest.fixture(autouse=True)
+def _search_caches(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Start every test with empty search caches and the result cache disabled.
+
+    The result and render caches are process-global, so without this a
+    search test could be answered by an earlier test's (or ``_warmup``'s)
+    cached result and never run its SQL. Tests that exercise the result
+    cache itself opt back in with ``@pytest.mark.search_cache``.
+
+    Args:
+        request: Pytest request, used to read the test's markers
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    with search._search_cache_lock:
+        search._search_cache.clear()
+    search.render_search_results.cache_clear()
+
+    if request.node.get_closest_marker("search_cache") is None:
+        # A zero-size cache evicts every entry as soon as it is stored
+        monkeypatch.setattr(search, "SEARCH_CACHE_SIZE", 0)
 
 
 @pytest.fixture(scope="session")
-def sample_vocabulary_id(db_engine) -> str:
+def index_response(client: TestClient) -> Response:
     """
-    Get a valid vocabulary ID from the database for testing.
+    Fetch the index page once for the whole test session.
+
+    Tests that only inspect the rendered index page share this response
+    instead of issuing their own identical request.
 
     Args:
-        db_engine: Database engine fixture
+        client: FastAPI test client
 
     Returns:
-        str: A valid vocabulary ID from the database
+        Response: The response for GET /
     """
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = TestSessionLocal()
+    return client.get("/")
 
-    try:
-        vocab = session.query(Vocabulary).first()
-        if not vocab:
-            pytest.skip("No vocabularies found in database")
-        return vocab.vocabulary_id
-    finally:
-        session.close()
+
+@pytest.fixture(scope="session")
+def index_dom(index_response: Response) -> "LexborHTMLParser":
+    """
+    Parse the index page once for the whole test session.
+
+    Structural checks (document root, search form) query this parsed tree
+    with CSS selectors instead of scanning the body text in every test.
+
+    Args:
+        index_response: Session-cached response for the index page
+
+    Returns:
+        LexborHTMLParser: Parsed HTML document of the index page
+    """
+    from selectolax.lexbor import LexborHTMLParser
+
+    return LexborHTMLParser(index_response.content)
 
 
 @pytest.fixture(scope="session")
-def sample_domain_id(db_engine) -> str:
+def sample_concept_id(db_engine) -> int:
     """
-    Get a valid domain ID from the database for testing.
+    Get a valid concept ID from the database for testing.
+
+    Queries the database for a standard SNOMED concept to use in tests.
+    Falls back to any standard concept if SNOMED is not available.
 
     Args:
         db_engine: Database engine fixture
 
     Returns:
-        str: A valid domain ID from the database
+        int: A valid concept ID from the database
     """
     TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
     session = TestSessionLocal()
 
     try:
-        domain = session.query(Domain).first()
-        if not domain:
-            pytest.skip("No domains found in database")
-        return domain.domain_id
+        # Try to get a SNOMED standard concept
+        concept = session.query(Concept).filter(
+            Concept.vocabulary_id == "SNOMED",
+            Concept.standard_concept == "S",
+            Concept.domain_id == "Condition"
+        ).first()
+
+        # Fallback to any standard concept
+        if not concept:
+            concept = session.query(Concept).filter(
+                Concept.standard_concept == "S"
+            ).first()
+
+        if not concept:
+            pytest.skip("No standard concepts found in database")
+
+        return concept.concept_id
     finally:
         session.close()
 
@@ -232,131 +451,304 @@ def concept_with_hierarchy(db_engine) -> int:
         session.close()
 
 
+def _first_word(name: str) -> str:
+    """Return the first word of a concept name, or its first 10 characters."""
+    words = name.split()
+    return words[0] if words else name[:10]
+
+
 @pytest.fixture(scope="session")
-def searchable_term(db_engine) -> str:
+def vocabulary_fingerprint(db_engine) -> str:
     """
-    Get a searchable term from the database that returns results.
+    Summarize the target database and its vocabulary as a cache invalidation key.
+
+    The key combines the database URL (without the password), the highest
+    concept_id (a cheap primary-key lookup that moves when concepts are
+    added) and every ``vocabulary_version``, so pointing the tests at another
+    database or reloading the vocabulary makes the probes run again.
 
     Args:
         db_engine: Database engine fixture
 
     Returns:
-        str: A search term that should return results
+        str: URL, max concept_id and sorted ``vocabulary_id=version`` pairs joined by ``;``
     """
     TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
     session = TestSessionLocal()
 
     try:
-        # Get a concept name that we can search for
-        concept = session.query(Concept).filter(
-            Concept.standard_concept == "S"
-        ).first()
-
-        if not concept or not concept.concept_name:
-            pytest.skip("No searchable concepts found in database")
-
-        # Return the first word of the concept name as a search term
-        words = concept.concept_name.split()
-        return words[0] if words else concept.concept_name[:10]
+        max_concept_id = session.query(func.max(Concept.concept_id)).scalar()
+        rows = session.query(
+            Vocabulary.vocabulary_id, Vocabulary.vocabulary_version
+        ).order_by(Vocabulary.vocabulary_id).all()
+        return ";".join([
+            db_engine.url.render_as_string(hide_password=True),
+            f"max_concept_id={max_concept_id}",
+            *(f"{vocabulary_id}={version}" for vocabulary_id, version in rows),
+        ])
     finally:
         session.close()
 
 
+def _cached_probe(
+    pytestconfig: pytest.Config,
+    key: str,
+    fingerprint: str,
+    probe: Callable[[], Any],
+) -> Any:
+    """
+    Return a discovery probe result from the pytest cache, running it on a miss.
+
+    Results are stored in ``.pytest_cache`` together with the database
+    fingerprint, so reruns against an unchanged database skip the query.
+    Probes order their query, so a cached value matches a fresh run.
+
+    Args:
+        pytestconfig: Pytest config, which owns the cross-run cache
+        key: Cache key under ``ohdsi/``
+        fingerprint: Current database fingerprint
+        probe: Zero-argument function that queries the database
+
+    Returns:
+        Any: The JSON-serializable probe result
+    """
+    cache_key = f"ohdsi/{key}"
+    cached = pytestconfig.cache.get(cache_key, None)
+    if cached is not None and cached.get("fingerprint") == fingerprint:
+        return cached["value"]
+
+    value = probe()
+    pytestconfig.cache.set(cache_key, {"fingerprint": fingerprint, "value": value})
+    return value
+
+
 @pytest.fixture(scope="session")
-def standard_concept_term(db_engine) -> str:
+def standard_concept(
+    pytestconfig: pytest.Config,
+    db_engine,
+    vocabulary_fingerprint: str,
+) -> dict[str, str]:
     """
-    Get a search term that matches a standard concept (standard_concept = 'S').
+    Get the name, vocabulary and domain of a standard concept, persisted across runs.
+
+    The search-term fixtures and the sample vocabulary/domain IDs all derive
+    from this one concept, so searching for ``searchable_term`` with either
+    ID as a filter is guaranteed to return at least this concept.
 
     Args:
+        pytestconfig: Pytest config, which owns the cross-run cache
         db_engine: Database engine fixture
+        vocabulary_fingerprint: Cache invalidation key
 
     Returns:
-        str: A search term for a standard concept
+        dict: ``concept_name``, ``vocabulary_id`` and ``domain_id`` of the concept
     """
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = TestSessionLocal()
+    def probe() -> Optional[dict[str, str]]:
+        TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+        session = TestSessionLocal()
 
-    try:
-        # Get a standard concept
-        concept = session.query(Concept).filter(
-            Concept.standard_concept == "S"
-        ).first()
+        try:
+            concept = session.query(Concept).filter(
+                Concept.standard_concept == "S"
+            ).order_by(Concept.concept_id).first()
+            if not concept or not concept.concept_name:
+                return None
+            return {
+                "concept_name": concept.concept_name,
+                "vocabulary_id": concept.vocabulary_id,
+                "domain_id": concept.domain_id,
+            }
+        finally:
+            session.close()
 
-        if not concept or not concept.concept_name:
-            pytest.skip("No standard concepts found in database")
+    concept = _cached_probe(pytestconfig, "standard_concept", vocabulary_fingerprint, probe)
+    if not concept:
+        pytest.skip("No standard concepts found in database")
+    return concept
 
-        # Return a distinctive part of the name that should uniquely identify it
-        words = concept.concept_name.split()
-        return words[0] if words else concept.concept_name[:10]
-    finally:
-        session.close()
+
+@pytest.fixture(scope="session")
+def standard_concept_name(standard_concept: dict[str, str]) -> str:
+    """
+    Get the name of a standard concept.
+
+    ``searchable_term``, ``standard_concept_term`` and ``concept_with_typo``
+    all derive from this name.
+
+    Args:
+        standard_concept: Probed standard concept fields
+
+    Returns:
+        str: A standard concept name
+    """
+    return standard_concept["concept_name"]
 
 
 @pytest.fixture(scope="session")
-def non_standard_concept_term(db_engine) -> str:
+def sample_vocabulary_id(standard_concept: dict[str, str]) -> str:
+    """
+    Get a valid vocabulary ID that co-occurs with ``searchable_term``.
+
+    Args:
+        standard_concept: Probed standard concept fields
+
+    Returns:
+        str: A valid vocabulary ID from the database
+    """
+    return standard_concept["vocabulary_id"]
+
+
+@pytest.fixture(scope="session")
+def sample_domain_id(standard_concept: dict[str, str]) -> str:
+    """
+    Get a valid domain ID that co-occurs with ``searchable_term``.
+
+    Args:
+        standard_concept: Probed standard concept fields
+
+    Returns:
+        str: A valid domain ID from the database
+    """
+    return standard_concept["domain_id"]
+
+
+@pytest.fixture(scope="session")
+def searchable_term(standard_concept_name: str) -> str:
+    """
+    Get a searchable term from the database that returns results.
+
+    Args:
+        standard_concept_name: A standard concept name
+
+    Returns:
+        str: A search term that should return results
+    """
+    # Return the first word of the concept name as a search term
+    return _first_word(standard_concept_name)
+
+
+@pytest.fixture(scope="session")
+def standard_concept_term(standard_concept_name: str) -> str:
+    """
+    Get a search term that matches a standard concept (standard_concept = 'S').
+
+    Args:
+        standard_concept_name: A standard concept name
+
+    Returns:
+        str: A search term for a standard concept
+    """
+    # Return a distinctive part of the name that should uniquely identify it
+    return _first_word(standard_concept_name)
+
+
+@pytest.fixture(scope="session")
+def non_standard_concept_term(
+    pytestconfig: pytest.Config,
+    db_engine,
+    vocabulary_fingerprint: str,
+) -> Optional[str]:
     """
     Get a search term that matches a non-standard concept.
 
     Args:
+        pytestconfig: Pytest config, which owns the cross-run cache
         db_engine: Database engine fixture
+        vocabulary_fingerprint: Cache invalidation key
 
     Returns:
         str: A search term for a non-standard concept, or None if none exist
     """
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = TestSessionLocal()
+    def probe() -> Optional[str]:
+        TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+        session = TestSessionLocal()
 
-    try:
-        # Get a non-standard concept (where standard_concept is NULL or 'C' for classification)
-        concept = session.query(Concept).filter(
-            Concept.standard_concept.in_(['C', None])
-        ).first()
+        try:
+            # Get a non-standard concept (where standard_concept is NULL or 'C' for classification)
+            concept = session.query(Concept).filter(
+                Concept.standard_concept.in_(['C', None])
+            ).order_by(Concept.concept_id).first()
+            return concept.concept_name if concept else None
+        finally:
+            session.close()
 
-        if not concept or not concept.concept_name:
-            return None  # Return None instead of skipping - some tests need this
+    name = _cached_probe(pytestconfig, "non_standard_concept_name", vocabulary_fingerprint, probe)
+    if not name:
+        return None  # Return None instead of skipping - some tests need this
 
-        # Return a distinctive part of the name
-        words = concept.concept_name.split()
-        return words[0] if words else concept.concept_name[:10]
-    finally:
-        session.close()
+    # Return a distinctive part of the name
+    return _first_word(name)
 
 
 @pytest.fixture(scope="session")
-def concept_with_typo(db_engine) -> tuple[str, str]:
+def concept_with_code(
+    pytestconfig: pytest.Config,
+    db_engine,
+    vocabulary_fingerprint: str,
+    sample_vocabulary_id: str,
+) -> dict[str, Any]:
     """
-    Get a concept name and a version with a typo for testing fuzzy matching.
+    Get a concept from the sample vocabulary with a 4-10 character code, persisted across runs.
+
+    The code is long enough to take a 3-character prefix from and short
+    enough to be a plausible exact-match query, so every multi-field search
+    test can share this one lookup.
 
     Args:
+        pytestconfig: Pytest config, which owns the cross-run cache
         db_engine: Database engine fixture
+        vocabulary_fingerprint: Cache invalidation key
+        sample_vocabulary_id: A valid vocabulary ID from the database
 
     Returns:
-        tuple: (correct_term, typo_term) - the correct search term and a version with a typo
+        dict: ``concept_id`` and ``concept_code`` of the concept
     """
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = TestSessionLocal()
+    def probe() -> Optional[dict[str, Any]]:
+        TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+        session = TestSessionLocal()
 
-    try:
-        # Get a concept with a name long enough to introduce a typo
-        concept = session.query(Concept).filter(
-            Concept.standard_concept == "S"
-        ).first()
+        try:
+            row = session.query(Concept.concept_id, Concept.concept_code).filter(
+                Concept.vocabulary_id == sample_vocabulary_id,
+                func.length(Concept.concept_code).between(4, 10)
+            ).order_by(Concept.concept_id).first()
+            if not row:
+                return None
+            return {"concept_id": row.concept_id, "concept_code": row.concept_code}
+        finally:
+            session.close()
 
-        if not concept or not concept.concept_name or len(concept.concept_name) < 5:
-            pytest.skip("No suitable concepts found for typo testing")
+    concept = _cached_probe(pytestconfig, "concept_with_code", vocabulary_fingerprint, probe)
+    if not concept:
+        pytest.skip("No concepts with codes found")
+    return concept
 
-        correct_term = concept.concept_name.split()[0] if concept.concept_name.split() else concept.concept_name[:10]
 
-        # Create a typo by swapping two characters or removing a character
-        if len(correct_term) >= 4:
-            # Remove a character from the middle
-            typo_term = correct_term[:len(correct_term)//2] + correct_term[len(correct_term)//2 + 1:]
-        else:
-            typo_term = correct_term[:-1]  # Just remove last character
+@pytest.fixture(scope="session")
+def concept_with_typo(standard_concept_name: str) -> tuple[str, str]:
+    """
+    Get a concept name and a version with a typo for testing fuzzy matching.
 
-        return (correct_term, typo_term)
-    finally:
-        session.close()
+    Args:
+        standard_concept_name: A standard concept name
+
+    Returns:
+        tuple: (correct_term, typo_term) - the correct search term and a version with a typo
+    """
+    # Need a concept with a name long enough to introduce a typo
+    if len(standard_concept_name) < 5:
+        pytest.skip("No suitable concepts found for typo testing")
+
+    correct_term = _first_word(standard_concept_name)
+
+    # Create a typo by swapping two characters or removing a character
+    if len(correct_term) >= 4:
+        # Remove a character from the middle
+        typo_term = correct_term[:len(correct_term)//2] + correct_term[len(correct_term)//2 + 1:]
+    else:
+        typo_term = correct_term[:-1]  # Just remove last character
+
+    return (correct_term, typo_term)
 
 
 @pytest.fixture(scope="session")
@@ -388,3 +780,42 @@ def concept_with_maps_to_relationship(db_engine) -> int:
         return relationship.concept_id_1
     finally:
         session.close()
+
+
+@dataclass(frozen=True)
+class SearchSnapshot:
+    """Column-oriented view of the results of GET /search/?q={searchable_term}."""
+
+    concept_ids: tuple[int, ...]
+    names_lower: tuple[str, ...]
+
+
+@pytest.fixture(scope="session")
+def search_snapshot(
+    cached_get: Callable[..., CachedResponse],
+    searchable_term: str,
+) -> SearchSnapshot:
+    """
+    Decode the default search for ``searchable_term`` once into columns.
+
+    Tests that only inspect one field across all rows (IDs, lowercased names)
+    read a precomputed tuple instead of walking the JSON rows themselves.
+    The snapshot is guaranteed non-empty, so tests can index it directly.
+
+    Args:
+        cached_get: Memoized GET helper
+        searchable_term: A valid search term from the database
+
+    Returns:
+        SearchSnapshot: Column tuples of the search results
+    """
+    response = cached_get("/search/", {"q": searchable_term})
+    assert response.status_code == 200
+    rows = response.json
+    # The term is taken from a concept name, so the search must find it
+    assert rows, f"search for {searchable_term!r} returned no results"
+
+    return SearchSnapshot(
+        concept_ids=tuple(row["concept_id"] for row in rows),
+        names_lower=tuple(row["concept_name"].lower() for row in rows),
+    )
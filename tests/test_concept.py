@@ -4,6 +4,8 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from tests.conftest import is_html, rjson
+
 
 class TestConceptDetailEndpoint:
     """Test suite for the /concept/{concept_id} endpoint."""
@@ -25,7 +27,7 @@ class TestConceptDetailEndpoint:
 
         # Assertions
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
         # Should contain the concept ID somewhere in the response
         assert str(sample_concept_id) in response.text
 
@@ -49,7 +51,7 @@ class TestConceptDetailEndpoint:
 
         # Assertions
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
         assert str(sample_concept_id) in response.text
 
     def test_get_concept_not_found(
@@ -67,7 +69,7 @@ class TestConceptDetailEndpoint:
 
         # Assertions
         assert response.status_code == 404
-        data = response.json()
+        data = rjson(response)
         assert data["detail"] == "Concept not found"
 
     def test_get_concept_with_hierarchy(
@@ -87,7 +89,7 @@ class TestConceptDetailEndpoint:
 
         # Assertions
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
 
         # The response should include hierarchy sections
         # (Ancestors or descendants sections should be present)
@@ -112,7 +114,7 @@ class TestConceptDetailEndpoint:
 
         # Assertions
         assert response.status_code == 422
-        data = response.json()
+        data = rjson(response)
         assert "detail" in data
 
     def test_get_concept_zero_id(
@@ -145,7 +147,7 @@ class TestConceptDetailEndpoint:
         else:
             # If concept 0 doesn't exist, should return 404
             assert response.status_code == 404
-            data = response.json()
+            data = rjson(response)
             assert data["detail"] == "Concept not found"
 
     def test_get_concept_negative_id(
@@ -439,7 +441,7 @@ class TestConceptDetailEndpoint:
 
         # Assertions
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
 
         # Should have basic HTML structure
         response_text = response.text.lower()
@@ -465,7 +467,7 @@ class TestConceptDetailEndpoint:
         # Should not be JSON
         assert "application/json" not in response.headers.get("content-type", "")
         # Should be HTML
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
 
     def test_get_concept_performance(
         self,
@@ -548,7 +550,7 @@ class TestRelationshipExploration:
         # Test API response
         response = client.get(f"/concept/{concept_id}/similar")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert isinstance(data, list)
         assert len(data) >= 0
 
@@ -580,7 +582,7 @@ class TestRelationshipExploration:
         )
 
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
 
         # Verify HTML contains expected elements
         html = response.text
@@ -629,7 +631,7 @@ class TestRelationshipExploration:
         # Test API response
         response = client.get(f"/concept/{relationship.concept_id_1}/similar")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
 
         # Check that all concept_ids are unique
         concept_ids = [item["concept_id"] for item in data]
@@ -657,7 +659,7 @@ class TestRelationshipExploration:
         # Test API response
         response = client.get(f"/concept/{concept_id}/similar")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
 
         # Check that the concept itself is not in the results
         concept_ids = [item["concept_id"] for item in data]
@@ -675,7 +677,7 @@ class TestRelationshipExploration:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert isinstance(data, list)
 
     def test_search_descendants_empty_query(
@@ -689,7 +691,7 @@ class TestRelationshipExploration:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert len(data) == 0
 
     def test_search_descendants_htmx(
@@ -704,7 +706,7 @@ class TestRelationshipExploration:
         )
 
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
 
     def test_search_descendants_only_direct_children(
         self,
@@ -2,78 +2,92 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
+
+from tests.conftest import is_html, recorded_statements
+
+
+def contains(response: Response, needle: bytes) -> bool:
+    """Check the raw response body for a byte string without decoding it."""
+    return response.content.find(needle) != -1
 
 
 class TestIndexEndpoint:
     """Test suite for the / (index) endpoint."""
 
-    def test_index_success(
+    @pytest.mark.parametrize(
+        "headers",
+        [{}, {"HX-Request": "true"}],
+        ids=["plain", "htmx"],
+    )
+    def test_index_ok(
         self,
         client: TestClient,
+        index_response: Response,
+        headers: dict[str, str],
     ) -> None:
         """
-        Test successful retrieval of the index page.
+        Test successful retrieval of the index page, with and without HTMX.
+
+        The HTMX header should not change the response. The plain case reuses
+        the session-cached index response instead of issuing another request.
 
         Args:
             client: FastAPI test client
+            index_response: Session-cached response for the index page
+            headers: Extra request headers
         """
-        # Make request
-        response = client.get("/")
+        # Make request (plain case is already cached)
+        response = client.get("/", headers=headers) if headers else index_response
 
         # Assertions
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(response)
 
     def test_index_contains_vocabularies(
         self,
-        client: TestClient,
+        index_response: Response,
         sample_vocabulary_id: str,
     ) -> None:
         """
         Test index page contains vocabulary information.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             sample_vocabulary_id: A valid vocabulary ID from the database
         """
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
         # Should contain at least one vocabulary
-        assert sample_vocabulary_id in response.text
+        assert contains(index_response, sample_vocabulary_id.encode())
 
     def test_index_contains_domains(
         self,
-        client: TestClient,
+        index_response: Response,
         sample_domain_id: str,
     ) -> None:
         """
         Test index page contains domain information.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             sample_domain_id: A valid domain ID from the database
         """
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
         # Should contain at least one domain
-        assert sample_domain_id in response.text
+        assert contains(index_response, sample_domain_id.encode())
 
     def test_index_displays_multiple_vocabularies(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test index page displays multiple vocabularies.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Vocabulary
@@ -84,30 +98,27 @@ class TestIndexEndpoint:
         if len(vocabularies) < 2:
             pytest.skip("Need at least 2 vocabularies in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Should display multiple vocabularies
         vocab_count = 0
         for vocab in vocabularies:
-            if vocab.vocabulary_id in response.text:
+            if contains(index_response, vocab.vocabulary_id.encode()):
                 vocab_count += 1
 
         assert vocab_count >= 2, "Should display at least 2 vocabularies"
 
     def test_index_displays_multiple_domains(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test index page displays multiple domains.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Domain
@@ -118,30 +129,27 @@ class TestIndexEndpoint:
         if len(domains) < 2:
             pytest.skip("Need at least 2 domains in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Should display multiple domains
         domain_count = 0
         for domain in domains:
-            if domain.domain_id in response.text:
+            if contains(index_response, domain.domain_id.encode()):
                 domain_count += 1
 
         assert domain_count >= 2, "Should display at least 2 domains"
 
     def test_index_vocabularies_ordered(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test that vocabularies appear to be ordered.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Vocabulary
@@ -154,27 +162,24 @@ class TestIndexEndpoint:
         if len(vocabularies) < 2:
             pytest.skip("Need at least 2 vocabularies in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Check that vocabularies appear in the response
         # (Strict ordering check would be fragile due to HTML structure)
         for vocab in vocabularies:
-            assert vocab.vocabulary_id in response.text
+            assert contains(index_response, vocab.vocabulary_id.encode())
 
     def test_index_domains_ordered(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test that domains appear to be ordered.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Domain
@@ -187,84 +192,66 @@ class TestIndexEndpoint:
         if len(domains) < 2:
             pytest.skip("Need at least 2 domains in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Check that domains appear in the response
         for domain in domains:
-            assert domain.domain_id in response.text
+            assert contains(index_response, domain.domain_id.encode())
 
     def test_index_html_structure(
         self,
-        client: TestClient,
+        index_response: Response,
+        index_dom,
     ) -> None:
         """
         Test that index page has proper HTML structure.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
+            index_dom: Parsed HTML document of the index page
         """
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-
-        # Should have basic HTML structure
-        response_text = response.text.lower()
-        assert "<html" in response_text or "<!doctype" in response_text
-
-    def test_index_with_htmx_header(
-        self,
-        client: TestClient,
-    ) -> None:
-        """
-        Test index page with HTMX header (should behave same as regular request).
+        assert index_response.status_code == 200
+        assert is_html(index_response)
 
-        Args:
-            client: FastAPI test client
-        """
-        # Make request with HTMX header
-        response = client.get("/", headers={"HX-Request": "true"})
+        # Should be a real HTML document, not a fragment or error body; the
+        # parser adds an <html> root to any input, so check the raw bytes
+        body = index_response.content.lstrip().lower()
+        assert body.startswith(b"<!doctype html") or body.startswith(b"<html")
 
-        # Assertions
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        # Should have a head with a non-empty title
+        title = index_dom.css_first("head > title")
+        assert title is not None
+        assert title.text(strip=True)
 
     def test_index_returns_template_not_json(
         self,
-        client: TestClient,
+        index_response: Response,
     ) -> None:
         """
         Test that index returns a template response, not JSON.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
         """
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
         # Should not be JSON
-        assert "application/json" not in response.headers.get("content-type", "")
+        assert "application/json" not in index_response.headers.get("content-type", "")
         # Should be HTML
-        assert "text/html" in response.headers["content-type"]
+        assert is_html(index_response)
 
     def test_index_vocabulary_details(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test that index page displays vocabulary details beyond just IDs.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Vocabulary
@@ -275,14 +262,11 @@ class TestIndexEndpoint:
         if not vocabulary:
             pytest.skip("No vocabularies found in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Should display vocabulary ID at minimum
-        assert vocabulary.vocabulary_id in response.text
+        assert contains(index_response, vocabulary.vocabulary_id.encode())
 
         # May also display vocabulary name if the template includes it
         if vocabulary.vocabulary_name:
@@ -291,14 +275,14 @@ class TestIndexEndpoint:
 
     def test_index_domain_details(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test that index page displays domain details.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Domain
@@ -309,56 +293,46 @@ class TestIndexEndpoint:
         if not domain:
             pytest.skip("No domains found in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Should display domain ID
-        assert domain.domain_id in response.text
+        assert contains(index_response, domain.domain_id.encode())
 
     def test_index_handles_empty_database_gracefully(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test that index page renders even with minimal data.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
-        # Make request (database may or may not have data)
-        response = client.get("/")
-
         # Assertions
         # Should always return 200 even if database is empty
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert index_response.status_code == 200
+        assert is_html(index_response)
 
     def test_index_search_form_present(
         self,
-        client: TestClient,
+        index_response: Response,
+        index_dom,
     ) -> None:
         """
         Test that index page contains a search form.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
+            index_dom: Parsed HTML document of the index page
         """
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Should have a form or search input
-        response_text = response.text.lower()
-        assert any(term in response_text for term in [
-            "<form", "search", "<input"
-        ])
+        assert index_dom.css_first("form, input[name='q']") is not None
 
     def test_index_performance(
         self,
@@ -381,16 +355,66 @@ class TestIndexEndpoint:
         # Should load within 3 seconds
         assert elapsed_time < 3.0, f"Index page took {elapsed_time:.2f}s to load"
 
-    def test_index_vocabulary_count(
+    @pytest.mark.benchmark(group="index")
+    def test_index_benchmark(
         self,
+        benchmark,
         client: TestClient,
+    ) -> None:
+        """
+        Test that index page renders within a tight steady-state budget.
+
+        Uses pytest-benchmark to time 20 rounds of 10 requests and checks the
+        fastest round, which filters out scheduling noise. Deselected by
+        default; run with ``pytest -m benchmark --benchmark-only``.
+
+        Args:
+            benchmark: pytest-benchmark fixture
+            client: FastAPI test client
+        """
+        benchmark.pedantic(client.get, args=("/",), iterations=10, rounds=20)
+
+        # No timings are collected under --benchmark-disable or xdist
+        if benchmark.stats is None:
+            pytest.skip("Benchmark timings are disabled")
+
+        # Fastest round should stay under 30ms per request
+        assert benchmark.stats["min"] < 0.03
+
+    def test_index_no_n_plus_one(
+        self,
+        client: TestClient,
+        db_engine,
+    ) -> None:
+        """
+        Test that the index page issues a constant number of SQL statements.
+
+        The page lists every vocabulary and domain; rendering must not fan out
+        into one query per row.
+
+        Args:
+            client: FastAPI test client
+            db_engine: Database engine fixture
+        """
+        with recorded_statements(db_engine) as statements:
+            response = client.get("/")
+
+        # Assertions
+        assert response.status_code == 200
+        # One query for vocabularies, one for domains (plus slack); savepoint
+        # statements from the shared test connection are not counted
+        assert len(statements) <= 3, f"Index issued {len(statements)} statements"
+
+    def test_index_vocabulary_count(
+        self,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test that index displays correct number of vocabularies.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Vocabulary
@@ -401,11 +425,8 @@ class TestIndexEndpoint:
         if vocab_count == 0:
             pytest.skip("No vocabularies in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Verify at least some vocabularies are displayed
         # (Exact count matching would be fragile due to HTML structure)
@@ -413,14 +434,14 @@ class TestIndexEndpoint:
 
     def test_index_domain_count(
         self,
-        client: TestClient,
+        index_response: Response,
         db_session,
     ) -> None:
         """
         Test that index displays correct number of domains.
 
         Args:
-            client: FastAPI test client
+            index_response: Session-cached response for the index page
             db_session: Database session
         """
         from app.models import Domain
@@ -431,11 +452,8 @@ class TestIndexEndpoint:
         if domain_count == 0:
             pytest.skip("No domains in database")
 
-        # Make request
-        response = client.get("/")
-
         # Assertions
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
         # Verify at least some domains are displayed
         assert domain_count > 0
@@ -1,310 +1,355 @@
 """Tests for the search endpoint using live database."""
 
-from typing import Any
+from typing import Any, Callable, Optional
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
 from sqlalchemy import func
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 
-from app.models import Concept
-
-
+from app.database import FUZZY_THRESHOLD
+from app.routers.search import render_search_results, search_cache_key
+from app.schemas import ConceptBase
+from tests.conftest import CachedResponse, SearchSnapshot, is_html, recorded_statements, rjson
+
+
+BASE = "/search/"
+
+# Validates a whole JSON search response against the endpoint's response model
+CONCEPTS = TypeAdapter(list[ConceptBase])
+
+
+def get_ok(client: TestClient, params: dict[str, Any]) -> Any:
+    """GET the search endpoint, assert 200 with the body in the failure message, and decode it."""
+    response = client.get(BASE, params=params)
+    assert response.status_code == 200, f"{response.status_code} from {response.url}: {response.text[:500]}"
+    return rjson(response)
+
+
+# Filter combinations for test_search_filters_applied: (term fixture, filters).
+# vocabulary_id/domain_id values name the fixture that supplies the real ID.
+FILTER_CASES = [
+    pytest.param(
+        "searchable_term", {"vocabulary_id": "sample_vocabulary_id"},
+        id="vocabulary",
+    ),
+    pytest.param(
+        "searchable_term", {"domain_id": "sample_domain_id"},
+        id="domain",
+    ),
+    pytest.param(
+        "searchable_term",
+        {"vocabulary_id": "sample_vocabulary_id", "domain_id": "sample_domain_id"},
+        id="vocabulary-and-domain",
+    ),
+    pytest.param(
+        "standard_concept_term",
+        {
+            "fuzzy": "true",
+            "standard_only": "true",
+            "vocabulary_id": "sample_vocabulary_id",
+            "domain_id": "sample_domain_id",
+        },
+        id="all-filters",
+    ),
+]
+
+# Blank or missing queries, which must short-circuit to an empty list
+BLANK_QUERIES = [
+    pytest.param({"q": ""}, id="empty"),
+    pytest.param({"q": "   "}, id="whitespace"),
+    pytest.param({}, id="missing"),
+]
+
+# Queries that must not crash the search: single character, numeric, punctuation
+SMOKE_QUERIES = [
+    pytest.param("a", id="single-char"),
+    pytest.param("123", id="numeric"),
+    pytest.param("type-2", id="special-chars"),
+]
+
+# fuzzy values: only "true" enables fuzzy mode; None omits the parameter
+FUZZY_VALUES = [
+    pytest.param("true", id="true"),
+    pytest.param("false", id="false"),
+    pytest.param("1", id="other"),
+    pytest.param(None, id="default"),
+]
+
+# standard_only values: only "true" enables the filter; None omits the parameter
+STANDARD_ONLY_VALUES = [
+    pytest.param("true", id="true"),
+    pytest.param("false", id="false"),
+    pytest.param(None, id="default"),
+]
+
+# Explicit and default limits for test_search_respects_limit: (params, max results)
+LIMIT_CASES = [
+    pytest.param({"limit": 5}, 5, id="custom"),
+    pytest.param({}, 50, id="default"),
+    pytest.param({"limit": 1}, 1, id="boundary"),
+]
+
+# HTMX variants for test_htmx_search_returns_html: (term fixture, extra params)
+HTMX_CASES = [
+    pytest.param("searchable_term", {}, id="plain"),
+    pytest.param("searchable_term", {"fuzzy": "true"}, id="fuzzy"),
+    pytest.param("standard_concept_term", {"standard_only": "true"}, id="standard-only"),
+    pytest.param(
+        "standard_concept_term", {"fuzzy": "true", "standard_only": "true"},
+        id="fuzzy-standard-only",
+    ),
+]
+
+# fuzzy x standard_only flag matrix for test_fuzzy_standard_only_matrix
+FLAG_MATRIX = [
+    pytest.param(fuzzy, standard_only, id=f"fuzzy={fuzzy}-standard_only={standard_only}")
+    for fuzzy in ("true", "false")
+    for standard_only in ("true", "false")
+]
+
+
+@pytest.mark.xdist_group("search_readonly")
 class TestSearchEndpoint:
     """Test suite for the /search/ endpoint."""
 
     def test_search_basic_query_json_response(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         searchable_term: str,
     ) -> None:
         """
         Test basic search with JSON response (no HTMX header).
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             searchable_term: A valid search term from the database
         """
         # Make request without HTMX header
-        response = client.get(f"/search/?q={searchable_term}")
+        response = cached_get(BASE, {"q": searchable_term})
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+        assert response.content_type == "application/json"
+        # Verify response structure (strict: no str -> int coercion)
+        results = CONCEPTS.validate_json(response.content, strict=True)
         # Should return at least one result
-        assert len(data) > 0
-
-        # Verify response structure
-        first_result = data[0]
-        assert "concept_id" in first_result
-        assert "concept_name" in first_result
-        assert isinstance(first_result["concept_id"], int)
-        assert isinstance(first_result["concept_name"], str)
+        assert len(results) > 0
 
-    def test_search_with_htmx_header(
+    @pytest.mark.parametrize("term_fixture,filters", FILTER_CASES)
+    def test_search_filters_applied(
         self,
-        client: TestClient,
-        searchable_term: str,
+        request: pytest.FixtureRequest,
+        cached_get: Callable[..., CachedResponse],
+        term_fixture: str,
+        filters: dict[str, str],
     ) -> None:
         """
-        Test search with HTMX header returns HTML template.
+        Test that every result satisfies the requested filter combination.
 
         Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
-        """
-        # Make request with HTMX header
-        response = client.get(
-            f"/search/?q={searchable_term}",
-            headers={"HX-Request": "true"},
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-        # HTML response should contain table or list structure
-        assert len(response.text) > 0
-
-    def test_search_with_vocabulary_filter(
-        self,
-        client: TestClient,
-        searchable_term: str,
-        sample_vocabulary_id: str,
-    ) -> None:
+            request: Pytest request, used to resolve fixture-backed values
+            cached_get: Memoized GET helper
+            term_fixture: Name of the fixture supplying the search term
+            filters: Query parameters; ID filters name the fixture with the value
         """
-        Test search with vocabulary_id filter.
+        term = request.getfixturevalue(term_fixture)
+        params = {
+            key: request.getfixturevalue(value) if key in ("vocabulary_id", "domain_id") else value
+            for key, value in filters.items()
+        }
 
-        Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
-            sample_vocabulary_id: A valid vocabulary ID from the database
-        """
-        # Make request with vocabulary filter
-        response = client.get(
-            f"/search/?q={searchable_term}&vocabulary_id={sample_vocabulary_id}"
-        )
+        # Make request with the filter combination
+        response = cached_get(BASE, {"q": term, **params})
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
+        data = response.json
         assert isinstance(data, list)
 
-        # If results exist, verify they match the filter
-        if len(data) > 0:
-            for concept in data:
-                assert concept["vocabulary_id"] == sample_vocabulary_id
-
-    def test_search_with_domain_filter(
-        self,
-        client: TestClient,
-        searchable_term: str,
-        sample_domain_id: str,
-    ) -> None:
-        """
-        Test search with domain_id filter.
-
-        Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
-            sample_domain_id: A valid domain ID from the database
-        """
-        # Make request with domain filter
-        response = client.get(
-            f"/search/?q={searchable_term}&domain_id={sample_domain_id}"
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+        # The sample IDs come from the concept behind the term, so the
+        # filtered search always finds at least that concept
+        assert len(data) > 0
 
-        # If results exist, verify they match the filter
-        if len(data) > 0:
-            for concept in data:
-                assert concept["domain_id"] == sample_domain_id
+        # Verify every result matches every filter
+        if "vocabulary_id" in params:
+            assert {c["vocabulary_id"] for c in data} == {params["vocabulary_id"]}
+        if "domain_id" in params:
+            assert {c["domain_id"] for c in data} == {params["domain_id"]}
+        if params.get("standard_only") == "true":
+            assert {c["standard_concept"] for c in data} == {"S"}
 
-    def test_search_with_both_filters(
+    @pytest.mark.parametrize("params,max_results", LIMIT_CASES)
+    def test_search_respects_limit(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         searchable_term: str,
-        sample_vocabulary_id: str,
-        sample_domain_id: str,
+        params: dict[str, int],
+        max_results: int,
     ) -> None:
         """
-        Test search with both vocabulary_id and domain_id filters.
+        Test search never returns more rows than the explicit or default limit.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             searchable_term: A valid search term from the database
-            sample_vocabulary_id: A valid vocabulary ID from the database
-            sample_domain_id: A valid domain ID from the database
+            params: Extra query parameters (the limit, if any)
+            max_results: Largest acceptable result count
         """
-        # Make request with both filters
-        response = client.get(
-            f"/search/?q={searchable_term}&vocabulary_id={sample_vocabulary_id}&domain_id={sample_domain_id}"
-        )
+        response = cached_get(BASE, {"q": searchable_term, **params})
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-        # If results exist, verify they match both filters
-        if len(data) > 0:
-            for concept in data:
-                assert concept["vocabulary_id"] == sample_vocabulary_id
-                assert concept["domain_id"] == sample_domain_id
+        # Should respect the limit; the count header matches the body
+        count = int(response.headers["x-result-count"])
+        assert count <= max_results
+        assert count == len(response.json)
 
-    def test_search_with_custom_limit(
+    @pytest.mark.parametrize("params", BLANK_QUERIES)
+    def test_search_blank_query_returns_empty_results(
         self,
-        client: TestClient,
-        searchable_term: str,
+        no_db_client: TestClient,
+        params: dict[str, str],
     ) -> None:
         """
-        Test search with custom limit parameter.
+        Test empty, whitespace-only and missing queries return [] (not an error).
+
+        This prevents validation errors when HTMX triggers on empty input.
+        Blank queries short-circuit before any SQL, so they run against a
+        client whose database session is a stub that fails on use.
 
         Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
+            no_db_client: Test client without a database
+            params: Query parameters with a blank or missing q
         """
-        # Make request with custom limit
-        limit = 5
-        response = client.get(f"/search/?q={searchable_term}&limit={limit}")
+        response = no_db_client.get(BASE, params=params)
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Should respect the limit
-        assert len(data) <= limit
+        assert response.content == b"[]"
 
-    def test_search_default_limit(
+    @pytest.mark.search_cache
+    def test_repeat_search_served_from_result_cache(
         self,
         client: TestClient,
+        db_engine: Engine,
         searchable_term: str,
     ) -> None:
         """
-        Test search uses default limit of 50 when not specified.
+        Test an identical search is answered from the in-process result cache.
 
         Args:
             client: FastAPI test client
+            db_engine: Database engine fixture
             searchable_term: A valid search term from the database
         """
-        # Make request without limit
-        response = client.get(f"/search/?q={searchable_term}")
+        # Caches start empty for each test, so the first request is a miss
+        params = {"q": searchable_term}
+
+        with recorded_statements(db_engine) as first_statements:
+            first = get_ok(client, params)
+        with recorded_statements(db_engine) as second_statements:
+            second = get_ok(client, params)
 
         # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Should not exceed default limit of 50
-        assert len(data) <= 50
+        assert second == first
+        assert len(first_statements) > 0
+        # The repeat must not touch the database
+        assert second_statements == []
 
-    def test_search_empty_query_returns_empty_results(
+    def test_search_no_results(
         self,
         client: TestClient,
     ) -> None:
         """
-        Test search with empty query returns empty results (not an error).
-
-        This prevents validation errors when HTMX triggers on empty input.
+        Test search that returns no results.
 
         Args:
             client: FastAPI test client
         """
-        # Make request with empty query
-        response = client.get("/search/?q=")
-
-        # Assertions
+        # Make request with a term unlikely to exist
+        response = client.get(BASE, params={"q": "xyznonexistentconceptxyz123"})
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) == 0
+        # May or may not have results depending on fuzzy matching
+        # Just verify it doesn't error; the count header avoids parsing the body
+        assert int(response.headers["x-result-count"]) >= 0
 
-    def test_search_whitespace_query_returns_empty_results(
+    def test_search_similarity_ordering(
         self,
-        client: TestClient,
+        search_snapshot: SearchSnapshot,
+        searchable_term: str,
     ) -> None:
         """
-        Test search with whitespace-only query returns empty results.
+        Test search results are ordered by similarity.
 
         Args:
-            client: FastAPI test client
+            search_snapshot: Column view of the default search results
+            searchable_term: A valid search term from the database
         """
-        # Make request with whitespace-only query
-        response = client.get("/search/?q=   ")
+        names_lower = search_snapshot.names_lower
 
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) == 0
+        # The most similar results should appear first:
+        # first result should contain the search term (case insensitive)
+        assert searchable_term.lower() in names_lower[0]
 
-    def test_search_no_results(
+    @pytest.mark.parametrize("q", SMOKE_QUERIES)
+    def test_search_smoke(
         self,
         client: TestClient,
+        q: str,
     ) -> None:
         """
-        Test search that returns no results.
+        Test unusual queries (single character, numeric, punctuation) do not crash.
+
+        Only the status and response shape matter, so ``limit=1`` keeps the
+        database work to the cheapest form of each query.
 
         Args:
             client: FastAPI test client
+            q: Search query
         """
-        # Make request with a term unlikely to exist
-        response = client.get("/search/?q=xyznonexistentconceptxyz123")
-
-        # Assertions
+        response = client.get(BASE, params={"q": q, "limit": 1})
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # May or may not have results depending on fuzzy matching
-        # Just verify it doesn't error
+        assert int(response.headers["x-result-count"]) <= 1
 
-    def test_search_similarity_ordering(
+    def test_search_strips_query_whitespace(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         searchable_term: str,
     ) -> None:
         """
-        Test search results are ordered by similarity.
+        Test surrounding whitespace does not change the results.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             searchable_term: A valid search term from the database
         """
-        # Make request
-        response = client.get(f"/search/?q={searchable_term}")
+        padded = cached_get(BASE, {"q": f"  {searchable_term} "})
+        plain = cached_get(BASE, {"q": searchable_term})
 
         # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-        # Verify results exist and are ordered
-        # The most similar results should appear first
-        if len(data) > 1:
-            # First result should contain the search term (case insensitive)
-            assert searchable_term.lower() in data[0]["concept_name"].lower()
+        assert padded.status_code == 200
+        assert padded.content == plain.content
 
-    def test_search_with_special_characters(
+    def test_single_char_fuzzy_falls_back_to_exact(
         self,
         client: TestClient,
     ) -> None:
         """
-        Test search with special characters in query.
+        Test a one-character fuzzy query is answered by substring match.
 
         Args:
             client: FastAPI test client
         """
-        # Make request with special characters (URL encoded)
-        response = client.get("/search/?q=type-2")
+        params = {"q": "a", "limit": 5}
+        fuzzy = client.get(BASE, params={**params, "fuzzy": "true"})
+        exact = client.get(BASE, params=params)
 
         # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Just verify it doesn't crash with special characters
+        assert fuzzy.status_code == 200
+        assert fuzzy.content == exact.content
 
     def test_search_case_insensitive(
         self,
@@ -314,148 +359,102 @@ class TestSearchEndpoint:
         """
         Test search is case insensitive.
 
+        Matching (ILIKE) and ranking (lower()) both ignore case, so the
+        uppercase and lowercase queries must return the same concepts. The
+        result cache is off for this test, so each request runs its own SQL.
+
         Args:
             client: FastAPI test client
             searchable_term: A valid search term from the database
         """
-        # Make request with uppercase query
-        response_upper = client.get(f"/search/?q={searchable_term.upper()}")
-        response_lower = client.get(f"/search/?q={searchable_term.lower()}")
+        upper = get_ok(client, {"q": searchable_term.upper()})
+        lower = get_ok(client, {"q": searchable_term.lower()})
 
         # Assertions
-        assert response_upper.status_code == 200
-        assert response_lower.status_code == 200
+        assert upper
+        assert [c["concept_id"] for c in upper] == [c["concept_id"] for c in lower]
 
-        data_upper = response_upper.json()
-        data_lower = response_lower.json()
+    @pytest.mark.parametrize("search_mode", ["exact", "fuzzy"])
+    def test_search_cache_key_folds_case(self, search_mode: str) -> None:
+        """
+        Test exact and fuzzy queries differing only in case share a cache key.
 
-        # Should return results regardless of case
-        assert isinstance(data_upper, list)
-        assert isinstance(data_lower, list)
+        Args:
+            search_mode: Case-insensitive search mode
+        """
+        filters = ("SNOMED", "Condition", True, 50)
+        assert search_cache_key(search_mode, "DiaBetes", *filters) == \
+               search_cache_key(search_mode, "diabetes", *filters)
+
+    def test_search_cache_key_keeps_semantic_case(self) -> None:
+        """Test semantic queries keep their case, since embeddings may depend on it."""
+        filters = (None, None, False, 50)
+        assert search_cache_key("semantic", "DiaBetes", *filters) != \
+               search_cache_key("semantic", "diabetes", *filters)
 
     def test_search_response_model_fields(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         searchable_term: str,
     ) -> None:
         """
         Test search response contains all expected ConceptBase fields.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             searchable_term: A valid search term from the database
         """
         # Make request
-        response = client.get(f"/search/?q={searchable_term}")
+        response = cached_get(BASE, {"q": searchable_term})
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+        # Verify required fields are present and typed
+        CONCEPTS.validate_json(response.content, strict=True)
 
-        if len(data) > 0:
-            concept = data[0]
-            # Verify all required fields are present
-            assert "concept_id" in concept
-            assert "concept_name" in concept
-            assert "domain_id" in concept
-            assert "vocabulary_id" in concept
-            assert "concept_class_id" in concept
-            assert "concept_code" in concept
-
-            # Verify optional fields
-            assert "standard_concept" in concept
-            assert "valid_start_date" in concept
-            assert "valid_end_date" in concept
-            assert "invalid_reason" in concept
+        # Optional fields must be serialized too, not just defaulted
+        assert ConceptBase.model_fields.keys() <= response.json[0].keys()
 
     def test_search_returns_valid_concept_ids(
         self,
-        client: TestClient,
-        searchable_term: str,
+        search_snapshot: SearchSnapshot,
     ) -> None:
         """
         Test that search returns valid concept IDs that can be used in other endpoints.
 
         Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
+            search_snapshot: Column view of the default search results
         """
-        # Make search request
-        response = client.get(f"/search/?q={searchable_term}")
+        # Verify concept IDs are positive integers
+        for concept_id in search_snapshot.concept_ids:
+            assert isinstance(concept_id, int)
+            assert concept_id > 0
 
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-
-        if len(data) > 0:
-            # Verify concept IDs are positive integers
-            for concept in data:
-                assert concept["concept_id"] > 0
-                assert isinstance(concept["concept_id"], int)
-
-    def test_search_with_very_short_term(
-        self,
-        client: TestClient,
-    ) -> None:
-        """
-        Test search with a single character query.
-
-        Args:
-            client: FastAPI test client
-        """
-        # Make request with single character
-        response = client.get("/search/?q=a")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Single character searches should still work
+    # ========================================================================
+    # FUZZY MATCHING TESTS
+    # ========================================================================
 
-    def test_search_with_numeric_query(
+    def test_fuzzy_threshold_set_on_new_connections(
         self,
-        client: TestClient,
+        db_engine: Engine,
     ) -> None:
         """
-        Test search with numeric query (might match concept codes).
-
-        Args:
-            client: FastAPI test client
-        """
-        # Make request with numeric query
-        response = client.get("/search/?q=123")
+        Test every new pooled connection carries the configured fuzzy threshold.
 
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Numeric searches should work without error
-
-    def test_search_limit_boundary(
-        self,
-        client: TestClient,
-        searchable_term: str,
-    ) -> None:
-        """
-        Test search with limit of 1 returns at most 1 result.
+        The connect listener only runs when the threshold is configured, so
+        the unconfigured case checks pg_trgm's own default.
 
         Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
+            db_engine: Database engine fixture
         """
-        # Make request with limit of 1
-        response = client.get(f"/search/?q={searchable_term}&limit=1")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) <= 1
+        with db_engine.connect() as conn:
+            # Force a new DBAPI connection so the connect listener runs
+            conn.invalidate()
+            # Load pg_trgm so its setting exists even without the listener
+            conn.exec_driver_sql("SELECT word_similarity('a', 'a')")
+            value = conn.exec_driver_sql("SHOW pg_trgm.word_similarity_threshold").scalar()
 
-    # ========================================================================
-    # FUZZY MATCHING TESTS
-    # ========================================================================
+        assert float(value) == FUZZY_THRESHOLD
 
     def test_fuzzy_matching_enabled_explicitly(
         self,
@@ -475,20 +474,15 @@ class TestSearchEndpoint:
         correct_term, typo_term = concept_with_typo
 
         # Make request with fuzzy matching explicitly enabled
-        response = client.get(f"/search/?q={typo_term}&fuzzy=true")
+        response = client.get(BASE, params={"q": typo_term, "fuzzy": "true", "limit": 1})
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
 
         # Fuzzy matching should potentially find results even with typos
         # Note: Results depend on similarity threshold and database content
-        # We just verify it doesn't error and returns a list
-        if len(data) > 0:
-            # Verify response structure is correct
-            assert "concept_id" in data[0]
-            assert "concept_name" in data[0]
+        # We just verify it doesn't error and returns well-formed concepts
+        CONCEPTS.validate_json(response.content, strict=True)
 
     def test_fuzzy_matching_disabled_exact_substring_match(
         self,
@@ -512,17 +506,13 @@ class TestSearchEndpoint:
             substring = searchable_term
 
         # Make request with fuzzy matching disabled
-        response = client.get(f"/search/?q={substring}&fuzzy=false")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": substring, "fuzzy": "false"})
         assert isinstance(data, list)
 
-        # Should find results containing the substring
-        if len(data) > 0:
-            # At least one result should contain the substring (case-insensitive)
-            assert any(substring.lower() in result["concept_name"].lower() for result in data)
+        # At least one result should contain the substring (case-insensitive);
+        # the concept the term was taken from always does
+        needle = substring.lower()
+        assert any(needle in result["concept_name"].lower() for result in data)
 
     def test_fuzzy_matching_disabled_no_typo_tolerance(
         self,
@@ -542,23 +532,18 @@ class TestSearchEndpoint:
         correct_term, typo_term = concept_with_typo
 
         # Make request with fuzzy matching disabled and typo
-        response = client.get(f"/search/?q={typo_term}&fuzzy=false")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": typo_term, "fuzzy": "false"})
         assert isinstance(data, list)
 
         # Results should only contain concepts with the typo as an exact substring
         # (not similarity-based matches)
-        if len(data) > 0:
-            for result in data:
-                # The typo should appear as an exact substring in the result
-                assert typo_term.lower() in result["concept_name"].lower()
+        # The typo should appear as an exact substring in every result
+        needle = typo_term.lower()
+        assert all(needle in result["concept_name"].lower() for result in data)
 
     def test_fuzzy_matching_default_behavior(
         self,
-        client: TestClient,
+        search_snapshot: SearchSnapshot,
         searchable_term: str,
     ) -> None:
         """
@@ -568,21 +553,15 @@ class TestSearchEndpoint:
         When fuzzy=None (not provided), use_fuzzy is False, so fuzzy is DISABLED by default.
 
         Args:
-            client: FastAPI test client
+            search_snapshot: Column view of the default search results
             searchable_term: A valid search term from the database
         """
-        # Make request without fuzzy parameter
-        response = client.get(f"/search/?q={searchable_term}")
+        names_lower = search_snapshot.names_lower
+        needle = searchable_term.lower()
 
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-        # Should return results using exact substring matching (ILIKE)
-        if len(data) > 0:
-            # Results should contain the search term as a substring
-            assert any(searchable_term.lower() in result["concept_name"].lower() for result in data)
+        # Should return results using exact substring matching (ILIKE):
+        # results should contain the search term as a substring
+        assert any(needle in name for name in names_lower)
 
     def test_fuzzy_matching_ordering_by_similarity(
         self,
@@ -600,49 +579,37 @@ class TestSearchEndpoint:
             searchable_term: A valid search term from the database
         """
         # Make request with fuzzy matching enabled
-        response = client.get(f"/search/?q={searchable_term}&fuzzy=true")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": searchable_term, "fuzzy": "true", "limit": 1})
         assert isinstance(data, list)
 
-        # If we have multiple results, the first should be most similar
-        if len(data) > 1:
-            # First result should contain the search term (case-insensitive)
-            # or be very similar to it
-            first_result_name = data[0]["concept_name"].lower()
-            # Most similar result should ideally contain the search term
-            assert searchable_term.lower() in first_result_name or \
-                   len(set(searchable_term.lower()) & set(first_result_name)) > 0
+        # The first result should be most similar: it should contain the
+        # search term (case-insensitive) or be very similar to it
+        first_result_name = data[0]["concept_name"].lower()
+        needle = searchable_term.lower()
+        assert needle in first_result_name or \
+               len(set(needle) & set(first_result_name)) > 0
 
+    @pytest.mark.parametrize("fuzzy", FUZZY_VALUES)
     def test_fuzzy_parameter_variations(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         searchable_term: str,
+        fuzzy: Optional[str],
     ) -> None:
         """
         Test various fuzzy parameter values.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             searchable_term: A valid search term from the database
+            fuzzy: Value of the fuzzy parameter, or None to omit it
         """
-        # Test fuzzy=true (enabled)
-        response_true = client.get(f"/search/?q={searchable_term}&fuzzy=true")
-        assert response_true.status_code == 200
+        params = {"q": searchable_term}
+        if fuzzy is not None:
+            params["fuzzy"] = fuzzy
 
-        # Test fuzzy=false (disabled)
-        response_false = client.get(f"/search/?q={searchable_term}&fuzzy=false")
-        assert response_false.status_code == 200
-
-        # Test fuzzy=anything_else (disabled - not "true")
-        response_other = client.get(f"/search/?q={searchable_term}&fuzzy=1")
-        assert response_other.status_code == 200
-
-        # Test no fuzzy parameter (default behavior)
-        response_none = client.get(f"/search/?q={searchable_term}")
-        assert response_none.status_code == 200
+        response = cached_get(BASE, params)
+        assert response.status_code == 200
 
     # ========================================================================
     # STANDARD CONCEPTS FILTER TESTS
@@ -663,17 +630,11 @@ class TestSearchEndpoint:
             standard_concept_term: A search term for a standard concept
         """
         # Make request with standard_only filter enabled
-        response = client.get(f"/search/?q={standard_concept_term}&standard_only=true")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": standard_concept_term, "standard_only": "true"})
         assert isinstance(data, list)
 
         # All results should be standard concepts
-        if len(data) > 0:
-            for concept in data:
-                assert concept["standard_concept"] == "S"
+        assert {c["standard_concept"] for c in data} <= {"S"}
 
     def test_standard_only_filter_disabled(
         self,
@@ -691,22 +652,16 @@ class TestSearchEndpoint:
             searchable_term: A valid search term from the database
         """
         # Make request with standard_only=false
-        response = client.get(f"/search/?q={searchable_term}&standard_only=false")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": searchable_term, "standard_only": "false", "limit": 1})
         assert isinstance(data, list)
 
         # Results can include both standard and non-standard concepts
         # We just verify it doesn't error and returns results
-        if len(data) > 0:
-            # Verify standard_concept field exists
-            assert "standard_concept" in data[0]
+        assert "standard_concept" in data[0]
 
     def test_standard_only_default_behavior(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         searchable_term: str,
     ) -> None:
         """
@@ -715,48 +670,47 @@ class TestSearchEndpoint:
         When standard_only is not provided, no filter should be applied.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             searchable_term: A valid search term from the database
         """
         # Make request without standard_only parameter
-        response = client.get(f"/search/?q={searchable_term}")
+        response = cached_get(BASE, {"q": searchable_term})
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
+        data = response.json
         assert isinstance(data, list)
 
-        # Should return results without filtering by standard_concept
-        if len(data) > 0:
-            # Results may include standard, classification, or non-standard concepts
-            assert "standard_concept" in data[0]
+        # Should return results without filtering by standard_concept;
+        # they may include standard, classification, or non-standard concepts
+        assert "standard_concept" in data[0]
 
+    @pytest.mark.parametrize("standard_only", STANDARD_ONLY_VALUES)
     def test_standard_only_parameter_variations(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         standard_concept_term: str,
+        standard_only: Optional[str],
     ) -> None:
         """
         Test various standard_only parameter values.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             standard_concept_term: A search term for a standard concept
+            standard_only: Value of the standard_only parameter, or None to omit it
         """
-        # Test standard_only=true (filter enabled)
-        response_true = client.get(f"/search/?q={standard_concept_term}&standard_only=true")
-        assert response_true.status_code == 200
-        data_true = response_true.json()
-        if len(data_true) > 0:
-            assert all(c["standard_concept"] == "S" for c in data_true)
+        params = {"q": standard_concept_term}
+        if standard_only is not None:
+            params["standard_only"] = standard_only
 
-        # Test standard_only=false (filter disabled)
-        response_false = client.get(f"/search/?q={standard_concept_term}&standard_only=false")
-        assert response_false.status_code == 200
+        response = cached_get(BASE, params)
+        assert response.status_code == 200
 
-        # Test no standard_only parameter (filter disabled)
-        response_none = client.get(f"/search/?q={standard_concept_term}")
-        assert response_none.status_code == 200
+        # Only "true" enables the filter
+        if standard_only == "true":
+            assert response.json
+            assert all(c["standard_concept"] == "S" for c in response.json)
 
     def test_standard_only_empty_results(
         self,
@@ -777,277 +731,148 @@ class TestSearchEndpoint:
             pytest.skip("No non-standard concepts available in database")
 
         # Make request with standard_only filter
-        response = client.get(f"/search/?q={non_standard_concept_term}&standard_only=true")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(
+            client,
+            {
+                "q": non_standard_concept_term,
+                "standard_only": "true",
+            },
+        )
         assert isinstance(data, list)
 
         # Results should either be empty or only contain standard concepts
-        for concept in data:
-            assert concept["standard_concept"] == "S"
+        assert {c["standard_concept"] for c in data} <= {"S"}
 
     # ========================================================================
     # COMBINED FILTERS TESTS
     # ========================================================================
 
-    def test_fuzzy_and_standard_only_both_enabled(
-        self,
-        client: TestClient,
-        standard_concept_term: str,
-    ) -> None:
-        """
-        Test fuzzy=true and standard_only=true together.
-
-        Both filters should apply: fuzzy similarity matching + standard concepts only.
-
-        Args:
-            client: FastAPI test client
-            standard_concept_term: A search term for a standard concept
-        """
-        # Make request with both filters enabled
-        response = client.get(
-            f"/search/?q={standard_concept_term}&fuzzy=true&standard_only=true"
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-        # All results should be standard concepts
-        if len(data) > 0:
-            for concept in data:
-                assert concept["standard_concept"] == "S"
-
-    def test_fuzzy_enabled_standard_only_disabled(
-        self,
-        client: TestClient,
-        searchable_term: str,
-    ) -> None:
-        """
-        Test fuzzy=true with standard_only=false/None.
-
-        Should use fuzzy matching without filtering by standard_concept.
-
-        Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
-        """
-        # Make request with fuzzy enabled, standard_only disabled
-        response = client.get(f"/search/?q={searchable_term}&fuzzy=true&standard_only=false")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-        # Should return results using fuzzy matching, no standard filter
-        if len(data) > 0:
-            assert "standard_concept" in data[0]
-
-    def test_fuzzy_disabled_standard_only_enabled(
-        self,
-        client: TestClient,
-        standard_concept_term: str,
-    ) -> None:
-        """
-        Test fuzzy=false with standard_only=true.
-
-        Should use exact substring matching with standard concepts filter.
-
-        Args:
-            client: FastAPI test client
-            standard_concept_term: A search term for a standard concept
-        """
-        # Make request with fuzzy disabled, standard_only enabled
-        response = client.get(
-            f"/search/?q={standard_concept_term}&fuzzy=false&standard_only=true"
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-        # All results should be standard concepts
-        if len(data) > 0:
-            for concept in data:
-                assert concept["standard_concept"] == "S"
-                # Should contain search term as substring
-                assert standard_concept_term.lower() in concept["concept_name"].lower()
-
-    def test_fuzzy_disabled_standard_only_disabled(
+    @pytest.mark.parametrize("fuzzy,standard_only", FLAG_MATRIX)
+    def test_fuzzy_standard_only_matrix(
         self,
-        client: TestClient,
-        searchable_term: str,
-    ) -> None:
-        """
-        Test fuzzy=false with standard_only=false.
-
-        Should use exact substring matching without standard filter.
-
-        Args:
-            client: FastAPI test client
-            searchable_term: A valid search term from the database
-        """
-        # Make request with both filters disabled
-        response = client.get(f"/search/?q={searchable_term}&fuzzy=false&standard_only=false")
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-        # Should return results using exact matching, no standard filter
-        if len(data) > 0:
-            assert "standard_concept" in data[0]
-
-    def test_all_filters_combined(
-        self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         standard_concept_term: str,
-        sample_vocabulary_id: str,
-        sample_domain_id: str,
+        fuzzy: str,
+        standard_only: str,
     ) -> None:
         """
-        Test all filters together: fuzzy, standard_only, vocabulary_id, domain_id.
+        Test every combination of the fuzzy and standard_only flags.
 
-        All filters should apply correctly in combination.
+        Only standard concepts may be returned when standard_only=true, and
+        exact mode (fuzzy=false) must match the term as a substring.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             standard_concept_term: A search term for a standard concept
-            sample_vocabulary_id: A valid vocabulary ID from the database
-            sample_domain_id: A valid domain ID from the database
+            fuzzy: Value of the fuzzy query parameter
+            standard_only: Value of the standard_only query parameter
         """
-        # Make request with all filters
-        response = client.get(
-            f"/search/?q={standard_concept_term}"
-            f"&fuzzy=true"
-            f"&standard_only=true"
-            f"&vocabulary_id={sample_vocabulary_id}"
-            f"&domain_id={sample_domain_id}"
+        response = cached_get(
+            BASE,
+            {"q": standard_concept_term, "fuzzy": fuzzy, "standard_only": standard_only},
         )
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+        data = response.json
+        # The term comes from a standard concept, so every combination finds it
+        assert len(data) > 0
 
-        # All results should match all filters
-        if len(data) > 0:
-            for concept in data:
-                assert concept["standard_concept"] == "S"
-                assert concept["vocabulary_id"] == sample_vocabulary_id
-                assert concept["domain_id"] == sample_domain_id
+        assert all("standard_concept" in c for c in data)
+        if standard_only == "true":
+            assert {c["standard_concept"] for c in data} == {"S"}
+        if fuzzy == "false":
+            # Exact mode should contain search term as substring
+            term = standard_concept_term.lower()
+            assert all(term in c["concept_name"].lower() for c in data)
 
     # ========================================================================
     # EDGE CASES AND HTMX TESTS
     # ========================================================================
 
-    def test_htmx_request_preserves_fuzzy_filter(
+    @pytest.mark.parametrize("term_fixture,params", HTMX_CASES)
+    def test_htmx_search_returns_html(
         self,
+        request: pytest.FixtureRequest,
         client: TestClient,
-        searchable_term: str,
+        term_fixture: str,
+        params: dict[str, str],
     ) -> None:
         """
-        Test HTMX requests work correctly with fuzzy parameter.
+        Test HTMX requests return the HTML results partial for every filter mix.
 
         Args:
+            request: Pytest request, used to resolve the term fixture
             client: FastAPI test client
-            searchable_term: A valid search term from the database
-        """
-        # Make HTMX request with fuzzy parameter
-        response = client.get(
-            f"/search/?q={searchable_term}&fuzzy=true",
-            headers={"HX-Request": "true"},
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-        assert len(response.text) > 0
-
-    def test_htmx_request_preserves_standard_only_filter(
-        self,
-        client: TestClient,
-        standard_concept_term: str,
-    ) -> None:
+            term_fixture: Name of the fixture supplying the search term
+            params: Extra query parameters
         """
-        Test HTMX requests work correctly with standard_only parameter.
+        term = request.getfixturevalue(term_fixture)
 
-        Args:
-            client: FastAPI test client
-            standard_concept_term: A search term for a standard concept
-        """
-        # Make HTMX request with standard_only parameter
+        # Make HTMX request
         response = client.get(
-            f"/search/?q={standard_concept_term}&standard_only=true",
+            BASE,
+            params={"q": term, **params},
             headers={"HX-Request": "true"},
         )
 
         # Assertions
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-        assert len(response.text) > 0
+        assert is_html(response)
+        # HTML response should contain table or list structure
+        assert response.content
 
-    def test_htmx_request_preserves_all_new_filters(
+    @pytest.mark.search_cache
+    def test_htmx_repeat_request_reuses_rendered_results(
         self,
         client: TestClient,
-        standard_concept_term: str,
+        searchable_term: str,
     ) -> None:
         """
-        Test HTMX requests work correctly with both fuzzy and standard_only parameters.
+        Test an identical HTMX search is served from the render cache.
 
         Args:
             client: FastAPI test client
-            standard_concept_term: A search term for a standard concept
+            searchable_term: A valid search term from the database
         """
-        # Make HTMX request with both new parameters
-        response = client.get(
-            f"/search/?q={standard_concept_term}&fuzzy=true&standard_only=true",
-            headers={"HX-Request": "true"},
-        )
+        params = {"q": searchable_term}
+        headers = {"HX-Request": "true"}
+
+        first = client.get(BASE, params=params, headers=headers)
+        hits_before = render_search_results.cache_info().hits
+        second = client.get(BASE, params=params, headers=headers)
 
         # Assertions
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-        assert len(response.text) > 0
+        assert first.status_code == second.status_code == 200
+        assert second.content == first.content
+        assert render_search_results.cache_info().hits == hits_before + 1
 
     def test_response_model_includes_standard_concept_field(
         self,
-        client: TestClient,
+        cached_get: Callable[..., CachedResponse],
         searchable_term: str,
     ) -> None:
         """
         Test response always includes standard_concept field.
 
         The standard_concept field should be present in all responses,
-        regardless of filter settings.
+        regardless of filter settings. The standard_only=true result set is a
+        subset of the unfiltered one, so a single unfiltered request covers
+        both: every row carries the field, including the standard rows.
 
         Args:
-            client: FastAPI test client
+            cached_get: Memoized GET helper
             searchable_term: A valid search term from the database
         """
-        # Test without filters
-        response = client.get(f"/search/?q={searchable_term}")
+        response = cached_get(BASE, {"q": searchable_term})
         assert response.status_code == 200
-        data = response.json()
-
-        if len(data) > 0:
-            assert "standard_concept" in data[0]
-
-        # Test with standard_only=true
-        response_filtered = client.get(f"/search/?q={searchable_term}&standard_only=true")
-        assert response_filtered.status_code == 200
-        data_filtered = response_filtered.json()
-
-        if len(data_filtered) > 0:
-            assert "standard_concept" in data_filtered[0]
-            assert data_filtered[0]["standard_concept"] == "S"
+        data = response.json
+        assert data
+        assert all("standard_concept" in concept for concept in data)
 
+        # The rows standard_only=true would return
+        standard_rows = [c for c in data if c["standard_concept"] == "S"]
+        assert standard_rows
 
 # ========================================================================
 # MULTI-FIELD SEARCH TESTS (PHASE 1)
@@ -1059,114 +884,63 @@ class TestMultiFieldSearch:
     def test_search_by_concept_code_exact_mode(
         self,
         client: TestClient,
-        db_session: Session,
+        concept_with_code: dict[str, Any],
     ) -> None:
         """Test searching by concept_code in exact mode."""
-        # Get a concept with a code
-        concept = db_session.query(Concept).filter(
-            Concept.concept_code.isnot(None),
-            Concept.concept_code != ''
-        ).first()
-
-        if not concept:
-            pytest.skip("No concepts with codes found")
-
         # Search by concept code
-        response = client.get(f"/search/?q={concept.concept_code}&fuzzy=false")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": concept_with_code["concept_code"], "fuzzy": "false"})
         assert len(data) > 0
 
         # Verify the concept is in results
         concept_ids = [c["concept_id"] for c in data]
-        assert concept.concept_id in concept_ids
+        assert concept_with_code["concept_id"] in concept_ids
 
     def test_code_match_ranked_higher_than_name_match(
         self,
         client: TestClient,
-        db_session: Session,
+        concept_with_code: dict[str, Any],
     ) -> None:
         """Test that exact code matches rank first."""
-        concept = db_session.query(Concept).filter(
-            Concept.concept_code.isnot(None),
-            func.length(Concept.concept_code) <= 10
-        ).first()
-
-        if not concept:
-            pytest.skip("No suitable concepts found")
+        code = concept_with_code["concept_code"]
+        data = get_ok(client, {"q": code, "fuzzy": "false", "limit": 1})
+        assert data
 
-        response = client.get(f"/search/?q={concept.concept_code}&fuzzy=false")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        if len(data) > 0:
-            # First result should be exact code match
-            assert data[0]["concept_code"].lower() == concept.concept_code.lower()
+        # First result should be exact code match
+        assert data[0]["concept_code"].lower() == code.lower()
 
     def test_fuzzy_mode_uses_exact_matching_for_codes(
         self,
         client: TestClient,
-        db_session: Session,
+        concept_with_code: dict[str, Any],
     ) -> None:
         """Test that fuzzy mode still does exact matching on codes."""
-        concept = db_session.query(Concept).filter(
-            Concept.concept_code.isnot(None),
-            Concept.concept_code != ''
-        ).first()
-
-        if not concept:
-            pytest.skip("No concepts with codes found")
-
         # Search in fuzzy mode
-        response = client.get(f"/search/?q={concept.concept_code}&fuzzy=true")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": concept_with_code["concept_code"], "fuzzy": "true"})
 
         # Should find the exact code match
         concept_ids = [c["concept_id"] for c in data]
-        assert concept.concept_id in concept_ids
+        assert concept_with_code["concept_id"] in concept_ids
 
     def test_partial_code_match(
         self,
         client: TestClient,
-        db_session: Session,
+        concept_with_code: dict[str, Any],
     ) -> None:
         """Test that partial code matches are found."""
-        concept = db_session.query(Concept).filter(
-            Concept.concept_code.isnot(None),
-            func.length(Concept.concept_code) > 3
-        ).first()
-
-        if not concept:
-            pytest.skip("No suitable concepts found")
-
         # Search with partial code
-        partial = concept.concept_code[:3]
-        response = client.get(f"/search/?q={partial}&fuzzy=false")
-
-        assert response.status_code == 200
-        data = response.json()
+        partial = concept_with_code["concept_code"][:3]
+        data = get_ok(client, {"q": partial, "fuzzy": "false"})
         assert len(data) > 0
 
     def test_htmx_response_includes_query_parameter(
         self,
         client: TestClient,
-        db_session: Session,
+        concept_with_code: dict[str, Any],
     ) -> None:
         """Test that HTMX responses can detect match types."""
-        concept = db_session.query(Concept).filter(
-            Concept.concept_code.isnot(None),
-            Concept.concept_code != ''
-        ).first()
-
-        if not concept:
-            pytest.skip("No concepts with codes found")
-
         response = client.get(
-            f"/search/?q={concept.concept_code}&fuzzy=false",
+            BASE,
+            params={"q": concept_with_code["concept_code"], "fuzzy": "false"},
             headers={"HX-Request": "true"}
         )
 
@@ -1180,10 +954,7 @@ class TestMultiFieldSearch:
         client: TestClient,
     ) -> None:
         """Test that standard concepts rank higher in exact mode."""
-        response = client.get("/search/?q=diabetes&fuzzy=false&limit=50")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": "diabetes", "fuzzy": "false", "limit": 50})
 
         # Just verify the ranking logic works without errors
         assert isinstance(data, list)
@@ -1191,30 +962,21 @@ class TestMultiFieldSearch:
     def test_multi_field_with_filters(
         self,
         client: TestClient,
-        db_session: Session,
+        concept_with_code: dict[str, Any],
         sample_vocabulary_id: str,
     ) -> None:
         """Test multi-field search works with vocabulary filter."""
-        concept = db_session.query(Concept).filter(
-            Concept.concept_code.isnot(None),
-            Concept.vocabulary_id == sample_vocabulary_id
-        ).first()
-
-        if not concept:
-            pytest.skip("No suitable concepts found")
-
-        response = client.get(
-            f"/search/?q={concept.concept_code[:3]}"
-            f"&vocabulary_id={sample_vocabulary_id}"
-            f"&fuzzy=false"
+        data = get_ok(
+            client,
+            {
+                "q": concept_with_code["concept_code"][:3],
+                "vocabulary_id": sample_vocabulary_id,
+                "fuzzy": "false",
+            },
         )
 
-        assert response.status_code == 200
-        data = response.json()
-
         # All results should match vocabulary filter
-        for result in data:
-            assert result["vocabulary_id"] == sample_vocabulary_id
+        assert {c["vocabulary_id"] for c in data} <= {sample_vocabulary_id}
 
 
 # ========================================================================
@@ -1235,18 +997,13 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Make semantic search request
-        response = client.get("/search/?q=diabetes&semantic=true&limit=10")
+        response = client.get(BASE, params={"q": "diabetes", "semantic": "true", "limit": 10})
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
-
         # Verify response structure
-        first_result = data[0]
-        assert "concept_id" in first_result
-        assert "concept_name" in first_result
+        results = CONCEPTS.validate_json(response.content, strict=True)
+        assert len(results) > 0
 
     def test_semantic_search_finds_related_concepts(
         self,
@@ -1261,10 +1018,7 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Search for diabetes
-        response = client.get("/search/?q=diabetes&semantic=true&limit=20")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": "diabetes", "semantic": "true", "limit": 20})
         assert len(data) > 0
 
         # Results should include diabetes-related terms
@@ -1290,17 +1044,60 @@ class TestSemanticSearch:
             sample_vocabulary_id: A valid vocabulary ID from the database
         """
         # Make semantic search request with vocabulary filter
-        response = client.get(
-            f"/search/?q=diabetes&semantic=true&vocabulary_id={sample_vocabulary_id}&limit=10"
+        data = get_ok(
+            client,
+            {
+                "q": "diabetes",
+                "semantic": "true",
+                "vocabulary_id": sample_vocabulary_id,
+                "limit": 10,
+            },
         )
 
-        assert response.status_code == 200
-        data = response.json()
-
         # All results should match the vocabulary filter
-        if len(data) > 0:
-            for concept in data:
-                assert concept["vocabulary_id"] == sample_vocabulary_id
+        assert {c["vocabulary_id"] for c in data} <= {sample_vocabulary_id}
+
+    def test_semantic_search_filtered_fills_limit(
+        self,
+        client: TestClient,
+        db_session: Session,
+        sample_vocabulary_id: str,
+    ) -> None:
+        """
+        Test a filtered semantic search returns a full page of results.
+
+        The approximate vector index applies filters after its scan and can
+        return too few rows; filtered searches must rank exactly instead. The
+        page is full when the vocabulary has at least ``limit`` embedded
+        concepts, and holds all of them otherwise.
+
+        Args:
+            client: FastAPI test client
+            db_session: Database session fixture
+            sample_vocabulary_id: A valid vocabulary ID from the database
+        """
+        from app.models import Concept, ConceptEmbedding
+
+        limit = 10
+        # Count embedded concepts in the vocabulary, stopping at limit
+        embedded = db_session.query(ConceptEmbedding.concept_id).join(
+            Concept, Concept.concept_id == ConceptEmbedding.concept_id
+        ).filter(Concept.vocabulary_id == sample_vocabulary_id).limit(limit).subquery()
+        embedded_count = db_session.query(func.count()).select_from(embedded).scalar()
+
+        data = get_ok(
+            client,
+            {
+                "q": "diabetes",
+                "semantic": "true",
+                "vocabulary_id": sample_vocabulary_id,
+                "limit": limit,
+            },
+        )
+
+        # Assertions
+        assert len(data) == min(limit, embedded_count)
+        assert all(c["vocabulary_id"] == sample_vocabulary_id for c in data)
 
     def test_semantic_search_with_domain_filter(
         self,
@@ -1315,17 +1112,18 @@ class TestSemanticSearch:
             sample_domain_id: A valid domain ID from the database
         """
         # Make semantic search request with domain filter
-        response = client.get(
-            f"/search/?q=pain&semantic=true&domain_id={sample_domain_id}&limit=10"
+        data = get_ok(
+            client,
+            {
+                "q": "pain",
+                "semantic": "true",
+                "domain_id": sample_domain_id,
+                "limit": 10,
+            },
         )
 
-        assert response.status_code == 200
-        data = response.json()
-
         # All results should match the domain filter
-        if len(data) > 0:
-            for concept in data:
-                assert concept["domain_id"] == sample_domain_id
+        assert {c["domain_id"] for c in data} <= {sample_domain_id}
 
     def test_semantic_search_with_standard_only(
         self,
@@ -1338,15 +1136,18 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Make semantic search request with standard_only filter
-        response = client.get("/search/?q=diabetes&semantic=true&standard_only=true&limit=10")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(
+            client,
+            {
+                "q": "diabetes",
+                "semantic": "true",
+                "standard_only": "true",
+                "limit": 10,
+            },
+        )
 
         # All results should be standard concepts
-        if len(data) > 0:
-            for concept in data:
-                assert concept["standard_concept"] == "S"
+        assert {c["standard_concept"] for c in data} <= {"S"}
 
     def test_semantic_search_with_all_filters(
         self,
@@ -1363,23 +1164,22 @@ class TestSemanticSearch:
             sample_domain_id: A valid domain ID
         """
         # Make semantic search request with all filters
-        response = client.get(
-            f"/search/?q=pain&semantic=true"
-            f"&vocabulary_id={sample_vocabulary_id}"
-            f"&domain_id={sample_domain_id}"
-            f"&standard_only=true"
-            f"&limit=10"
+        data = get_ok(
+            client,
+            {
+                "q": "pain",
+                "semantic": "true",
+                "vocabulary_id": sample_vocabulary_id,
+                "domain_id": sample_domain_id,
+                "standard_only": "true",
+                "limit": 10,
+            },
         )
 
-        assert response.status_code == 200
-        data = response.json()
-
         # All results should match all filters
-        if len(data) > 0:
-            for concept in data:
-                assert concept["vocabulary_id"] == sample_vocabulary_id
-                assert concept["domain_id"] == sample_domain_id
-                assert concept["standard_concept"] == "S"
+        assert {c["vocabulary_id"] for c in data} <= {sample_vocabulary_id}
+        assert {c["domain_id"] for c in data} <= {sample_domain_id}
+        assert {c["standard_concept"] for c in data} <= {"S"}
 
     def test_semantic_search_empty_query_returns_empty(
         self,
@@ -1392,10 +1192,7 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Make request with empty query
-        response = client.get("/search/?q=&semantic=true")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": "", "semantic": "true"})
         assert isinstance(data, list)
         assert len(data) == 0
 
@@ -1411,10 +1208,7 @@ class TestSemanticSearch:
         """
         # Make request with custom limit
         limit = 5
-        response = client.get(f"/search/?q=diabetes&semantic=true&limit={limit}")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": "diabetes", "semantic": "true", "limit": limit})
         assert len(data) <= limit
 
     def test_semantic_search_htmx_response(
@@ -1429,15 +1223,16 @@ class TestSemanticSearch:
         """
         # Make HTMX request
         response = client.get(
-            "/search/?q=diabetes&semantic=true&limit=10",
+            BASE,
+            params={"q": "diabetes", "semantic": "true", "limit": 10},
             headers={"HX-Request": "true"},
         )
 
         assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-        assert len(response.text) > 0
+        assert is_html(response)
+        assert response.content
         # Should contain semantic search mode indicator
-        assert "semantic" in response.text.lower()
+        assert b"semantic" in response.content.lower()
 
     def test_semantic_vs_exact_search_different_results(
         self,
@@ -1455,15 +1250,15 @@ class TestSemanticSearch:
         query = "diabetes"
 
         # Exact search
-        response_exact = client.get(f"/search/?q={query}&fuzzy=false&limit=10")
+        response_exact = client.get(BASE, params={"q": query, "fuzzy": "false", "limit": 10})
         # Semantic search
-        response_semantic = client.get(f"/search/?q={query}&semantic=true&limit=10")
+        response_semantic = client.get(BASE, params={"q": query, "semantic": "true", "limit": 10})
 
         assert response_exact.status_code == 200
         assert response_semantic.status_code == 200
 
-        data_exact = response_exact.json()
-        data_semantic = response_semantic.json()
+        data_exact = rjson(response_exact)
+        data_semantic = rjson(response_semantic)
 
         # Both should return results
         assert len(data_exact) > 0
@@ -1489,16 +1284,16 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Test semantic=true (enabled)
-        response_true = client.get("/search/?q=diabetes&semantic=true")
+        response_true = client.get(BASE, params={"q": "diabetes", "semantic": "true"})
         assert response_true.status_code == 200
-        assert len(response_true.json()) > 0
+        assert len(rjson(response_true)) > 0
 
         # Test semantic=false (disabled, should use exact search)
-        response_false = client.get("/search/?q=diabetes&semantic=false")
+        response_false = client.get(BASE, params={"q": "diabetes", "semantic": "false"})
         assert response_false.status_code == 200
 
         # Test no semantic parameter (default behavior - exact search)
-        response_none = client.get("/search/?q=diabetes")
+        response_none = client.get(BASE, params={"q": "diabetes"})
         assert response_none.status_code == 200
 
     def test_semantic_search_with_colloquial_terms(
@@ -1514,10 +1309,7 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Search with colloquial term
-        response = client.get("/search/?q=sugar disease&semantic=true&limit=10")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(client, {"q": "sugar disease", "semantic": "true", "limit": 10})
 
         # Should find some results
         assert len(data) > 0
@@ -1543,14 +1335,14 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Make requests with different cases
-        response_lower = client.get("/search/?q=diabetes&semantic=true&limit=10")
-        response_upper = client.get("/search/?q=DIABETES&semantic=true&limit=10")
+        response_lower = client.get(BASE, params={"q": "diabetes", "semantic": "true", "limit": 10})
+        response_upper = client.get(BASE, params={"q": "DIABETES", "semantic": "true", "limit": 10})
 
         assert response_lower.status_code == 200
         assert response_upper.status_code == 200
 
-        data_lower = response_lower.json()
-        data_upper = response_upper.json()
+        data_lower = rjson(response_lower)
+        data_upper = rjson(response_upper)
 
         # Both should return results
         assert len(data_lower) > 0
@@ -1567,10 +1359,14 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Make request with special characters
-        response = client.get("/search/?q=type-2 diabetes&semantic=true&limit=10")
-
-        assert response.status_code == 200
-        data = response.json()
+        data = get_ok(
+            client,
+            {
+                "q": "type-2 diabetes",
+                "semantic": "true",
+                "limit": 10,
+            },
+        )
         assert isinstance(data, list)
         # Should not crash with special characters
 
@@ -1585,24 +1381,14 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Make semantic search request
-        response = client.get("/search/?q=diabetes&semantic=true&limit=10")
+        response = client.get(BASE, params={"q": "diabetes", "semantic": "true", "limit": 10})
 
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) > 0
+        # Verify required fields are present and typed
+        assert len(CONCEPTS.validate_json(response.content, strict=True)) > 0
 
-        concept = data[0]
-        # Verify all required fields are present
-        assert "concept_id" in concept
-        assert "concept_name" in concept
-        assert "domain_id" in concept
-        assert "vocabulary_id" in concept
-        assert "concept_class_id" in concept
-        assert "concept_code" in concept
-        assert "standard_concept" in concept
-        assert "valid_start_date" in concept
-        assert "valid_end_date" in concept
-        assert "invalid_reason" in concept
+        # Optional fields must be serialized too, not just defaulted
+        assert ConceptBase.model_fields.keys() <= rjson(response)[0].keys()
 
     def test_semantic_and_fuzzy_mutually_exclusive(
         self,
@@ -1617,14 +1403,30 @@ class TestSemanticSearch:
             client: FastAPI test client
         """
         # Semantic search with fuzzy=true (semantic should take precedence)
-        response_both = client.get("/search/?q=diabetes&semantic=true&fuzzy=true&limit=10")
+        response_both = client.get(
+            BASE,
+            params={
+                "q": "diabetes",
+                "semantic": "true",
+                "fuzzy": "true",
+                "limit": 10,
+            },
+        )
 
         # Semantic search with fuzzy=false
-        response_semantic_only = client.get("/search/?q=diabetes&semantic=true&fuzzy=false&limit=10")
+        response_semantic_only = client.get(
+            BASE,
+            params={
+                "q": "diabetes",
+                "semantic": "true",
+                "fuzzy": "false",
+                "limit": 10,
+            },
+        )
 
         assert response_both.status_code == 200
         assert response_semantic_only.status_code == 200
 
         # Both should return results using semantic search
-        assert len(response_both.json()) > 0
-        assert len(response_semantic_only.json()) > 0
+        assert len(rjson(response_both)) > 0
+        assert len(rjson(response_semantic_only)) > 0